@@ -7,8 +7,10 @@ FastAPI dependencies for authentication, services, etc.
 from typing import Annotated
 
 from fastapi import Depends
+from fastapi import Query as QueryParam
 
 from peskas_api.core.auth import verify_api_key
+from peskas_api.models.params import DatasetQueryParams
 from peskas_api.services.gcs import GCSService, get_gcs_service
 from peskas_api.services.query import QueryService, get_query_service
 
@@ -16,3 +18,6 @@ from peskas_api.services.query import QueryService, get_query_service
 AuthenticatedUser = Annotated[str, Depends(verify_api_key)]
 GCS = Annotated[GCSService, Depends(get_gcs_service)]
 Query = Annotated[QueryService, Depends(get_query_service)]
+# Query string parsed straight into the model: one validation pass, and
+# model validator errors (e.g. date_to < date_from) become 422 responses
+DatasetParams = Annotated[DatasetQueryParams, QueryParam()]
@@ -4,116 +4,108 @@ Dataset endpoints.
 Generic endpoint handler that works with any dataset type.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
-from peskas_api.api.deps import AuthenticatedUser, GCS, Query
+from peskas_api.api.deps import AuthenticatedUser, DatasetParams, GCS, Query
 from peskas_api.core.exceptions import DataNotFoundError
-from peskas_api.models.params import DatasetQueryParams
 from peskas_api.models.enums import ResponseFormat
-from peskas_api.schema.dataset_config import get_dataset_type, get_all_dataset_types
+from peskas_api.schema.dataset_config import get_all_dataset_types, get_dataset_type_by_endpoint
 
 router = APIRouter(tags=["Datasets"])
 
+# DatasetQueryParams fields passed straight through to the query service
+_QUERY_FIELDS = frozenset(
+    {"date_from", "date_to", "gaul_1", "gaul_2", "catch_taxon", "survey_id", "limit"}
+)
 
-def create_dataset_endpoint(dataset_type_name: str):
+_DATASET_TYPES_DOC = "\n".join(
+    f"- `{ds_type.endpoint}`: {ds_type.description}" for ds_type in get_all_dataset_types()
+)
+
+
+@router.get(
+    "/{dataset_type}",
+    name="get_dataset",
+    summary="Get dataset records",
+    description=f"""
+Retrieve dataset records.
+
+Downloads the relevant Parquet file from GCS, applies filters,
+and streams the result as CSV or JSON.
+
+**Dataset types**:
+
+{_DATASET_TYPES_DOC}
+
+**GCS path pattern**: `{{country}}/{{status}}/` (latest versioned file)
+""",
+)
+def get_dataset(
+    dataset_type: str,
+    _auth: AuthenticatedUser,
+    gcs: GCS,
+    query_svc: Query,
+    params: DatasetParams,
+):
     """
-    Factory function to create dataset endpoints.
+    Retrieve records for any registered dataset type (see route description).
 
-    This enables dynamic endpoint creation based on dataset config.
+    Declared as a plain function so FastAPI runs it in the threadpool: the
+    GCS download and DuckDB query block, and must not stall the event loop.
     """
-    dataset_config = get_dataset_type(dataset_type_name)
+    dataset_config = get_dataset_type_by_endpoint(dataset_type)
     if dataset_config is None:
-        raise ValueError(f"Unknown dataset type: {dataset_type_name}")
-
-    async def get_dataset(
-        _auth: AuthenticatedUser,
-        gcs: GCS,
-        query_svc: Query,
-        params: DatasetQueryParams = Depends(),
-    ):
-        """
-        Retrieve dataset records.
-
-        Downloads the relevant Parquet file from GCS, applies filters,
-        and streams the result as CSV or JSON.
-        """
-        # Download parquet file
-        try:
-            parquet_path = gcs.download_parquet(
-                country=params.country,
-                status=params.status,
+        raise HTTPException(status_code=404, detail=f"Unknown dataset type: {dataset_type}")
+    dataset_type_name = dataset_config.name
+
+    # Download parquet file
+    try:
+        parquet_path = gcs.download_parquet(
+            country=params.country,
+            status=params.status,
+        )
+    except DataNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    # Resolve columns
+    try:
+        columns = params.get_columns(dataset_type_name)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if columns is not None and not columns:
+        raise HTTPException(status_code=400, detail="Scope resolves to no columns")
+
+    # Filter and limit arguments shared by both query paths
+    filters = params.model_dump(include=_QUERY_FIELDS)
+
+    # Query and respond
+    try:
+        if params.format == ResponseFormat.JSON:
+            # Stream JSON (query runs here so errors surface before streaming)
+            chunks = query_svc.stream_json(
+                parquet_path,
+                date_column=dataset_config.date_column,
+                columns=columns,
+                **filters,
+            )
+            return StreamingResponse(chunks, media_type="application/json")
+        else:
+            # Stream CSV (query runs here so errors surface before streaming)
+            chunks = query_svc.stream_csv(
+                parquet_path,
+                date_column=dataset_config.date_column,
+                columns=columns,
+                **filters,
             )
-        except DataNotFoundError as e:
-            raise HTTPException(status_code=404, detail=str(e))
-
-        # Resolve columns
-        try:
-            columns = params.get_columns(dataset_type_name)
-        except ValueError as e:
-            raise HTTPException(status_code=400, detail=str(e))
-
-        # Query and respond
-        try:
-            if params.format == ResponseFormat.JSON:
-                records = query_svc.get_as_records(
-                    parquet_path,
-                    date_column=dataset_config.date_column,
-                    date_from=params.date_from,
-                    date_to=params.date_to,
-                    gaul_1=params.gaul_1,
-                    gaul_2=params.gaul_2,
-                    catch_taxon=params.catch_taxon,
-                    survey_id=params.survey_id,
-                    columns=columns,
-                    limit=params.limit,
-                )
-                return JSONResponse(content={"data": records})
-            else:
-                # Stream CSV
-                def generate():
-                    yield from query_svc.stream_csv(
-                        parquet_path,
-                        date_column=dataset_config.date_column,
-                        date_from=params.date_from,
-                        date_to=params.date_to,
-                        gaul_1=params.gaul_1,
-                        gaul_2=params.gaul_2,
-                        catch_taxon=params.catch_taxon,
-                        survey_id=params.survey_id,
-                        columns=columns,
-                        limit=params.limit,
-                    )
-
-                filename = f"{dataset_type_name}_{params.country}_{params.status.value}.csv"
-                return StreamingResponse(
-                    generate(),
-                    media_type="text/csv",
-                    headers={"Content-Disposition": f"attachment; filename={filename}"},
-                )
-        except ValueError as e:
-            raise HTTPException(status_code=400, detail=str(e))
-        except FileNotFoundError as e:
-            raise HTTPException(status_code=404, detail=str(e))
-
-    return get_dataset
-
-
-# Dynamically create endpoints for each dataset type
-for ds_type in get_all_dataset_types():
-    endpoint_func = create_dataset_endpoint(ds_type.name)
-    endpoint_func.__doc__ = f"""
-    Retrieve {ds_type.description}.
-
-    **Dataset type**: `{ds_type.name}`
-
-    **GCS path pattern**: `{{country}}/{{status}}/` (latest versioned file)
-    """
 
-    router.add_api_route(
-        f"/{ds_type.endpoint}",
-        endpoint_func,
-        methods=["GET"],
-        name=f"get_{ds_type.name}",
-        summary=f"Get {ds_type.name} data",
-    )
+            filename = f"{dataset_type_name}_{params.country}_{params.status.value}.csv"
+            return StreamingResponse(
+                chunks,
+                media_type="text/csv",
+                headers={"Content-Disposition": f"attachment; filename={filename}"},
+            )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
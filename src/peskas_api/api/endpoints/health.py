@@ -1,25 +1,68 @@
 """Health check endpoint (no auth required)."""
 
+import asyncio
 import logging
+import time
 
 from fastapi import APIRouter
+from fastapi.concurrency import run_in_threadpool
 
 from peskas_api.api.deps import get_gcs_service
 from peskas_api.core.config import get_settings
 from peskas_api.models.responses import HealthResponse
+from peskas_api.services.gcs import gcs_errors
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Health"])
 
+# Last GCS probe as (monotonic timestamp, accessible)
+_gcs_probe: tuple[float, bool] | None = None
+_gcs_probe_lock = asyncio.Lock()
+
+
+def _probe_gcs() -> bool:
+    """Check that the GCS bucket is reachable (blocking network call)."""
+    try:
+        gcs = get_gcs_service()
+        # Quick check - just verify bucket exists
+        gcs.bucket.exists()
+        return True
+    except gcs_errors() as e:
+        logger.warning("Health check: GCS connection test failed - %s", e)
+        return False
+
+
+async def _gcs_accessible(ttl: float) -> bool:
+    """
+    Return GCS accessibility, probing at most once per `ttl` seconds.
+
+    The lock ensures concurrent health checks share a single probe
+    instead of each issuing their own request when the cache expires.
+    """
+    global _gcs_probe
+
+    if _gcs_probe is not None and time.monotonic() - _gcs_probe[0] < ttl:
+        return _gcs_probe[1]
+
+    async with _gcs_probe_lock:
+        # Another request may have refreshed the probe while we waited
+        if _gcs_probe is not None and time.monotonic() - _gcs_probe[0] < ttl:
+            return _gcs_probe[1]
+
+        accessible = await run_in_threadpool(_probe_gcs)
+        _gcs_probe = (time.monotonic(), accessible)
+        return accessible
+
 
 @router.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+async def health_check() -> dict:
     """
     Health check endpoint with GCS connectivity test.
 
     Returns service status, version, and GCS bucket accessibility.
-    No authentication required.
+    No authentication required. The GCS probe result is cached for
+    `HEALTH_CACHE_TTL` seconds.
     
     Returns:
         - status: "healthy" if all systems operational, "degraded" if GCS unavailable
@@ -28,20 +71,14 @@ async def health_check() -> HealthResponse:
     """
     settings = get_settings()
     
-    # Test GCS connectivity
-    gcs_accessible = True
-    try:
-        gcs = get_gcs_service()
-        # Quick check - just verify bucket exists
-        gcs.bucket.exists()
-    except Exception as e:
-        logger.warning(f"Health check: GCS connection test failed - {e}")
-        gcs_accessible = False
+    gcs_accessible = await _gcs_accessible(settings.health_cache_ttl)
     
     status = "healthy" if gcs_accessible else "degraded"
     
-    return HealthResponse(
-        status=status,
-        version=settings.api_version,
-        gcs_accessible=gcs_accessible,
-    )
+    # A plain dict: FastAPI validates it against HealthResponse once, instead
+    # of constructing the model here and dumping it back to a dict
+    return {
+        "status": status,
+        "version": settings.api_version,
+        "gcs_accessible": gcs_accessible,
+    }
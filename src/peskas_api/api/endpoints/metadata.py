@@ -9,24 +9,134 @@ These endpoints follow semantic web and FAIR data principles by providing
 machine-readable field definitions with ontology URLs where available.
 """
 
+import functools
+import hashlib
 import logging
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response
 
 from peskas_api.api.deps import AuthenticatedUser
+from peskas_api.core.config import get_settings
 from peskas_api.models.responses import DatasetMetadataResponse, FieldMetadataResponse, MetadataListResponse
-from peskas_api.schema.dataset_config import get_all_dataset_types, get_dataset_type
+from peskas_api.schema.dataset_config import get_dataset_type, get_dataset_type_names
 from peskas_api.schema.field_metadata import (
+    FieldMetadata,
     get_all_fields_metadata,
     get_fields_metadata_by_scope,
     get_field_metadata,
+    list_field_names,
 )
+from peskas_api.schema.scopes import get_available_scopes
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Metadata"])
 
 
+def _to_field_response(metadata: FieldMetadata) -> FieldMetadataResponse:
+    """
+    Convert a FieldMetadata dataclass to its response model.
+
+    Uses model_construct to skip validation: the values come from the
+    static schema definitions, not from user input.
+    """
+    return FieldMetadataResponse.model_construct(**metadata.to_dict())
+
+
+@functools.lru_cache(maxsize=512)
+def _field_response(dataset_type: str, field_name: str) -> FieldMetadataResponse:
+    """
+    Response model for one registry field, converted once and shared by
+    every scope and endpoint that includes it (field must exist).
+    """
+    return _to_field_response(get_field_metadata(field_name, dataset_type))
+
+
+@functools.lru_cache(maxsize=128)
+def _build_metadata_response(
+    dataset_type: str,
+    scope: str | None,
+) -> DatasetMetadataResponse:
+    """
+    Build the metadata response for a dataset type and optional scope.
+
+    Field metadata is static, so each response is built once and reused.
+    Callers must validate dataset_type and scope first so that only valid
+    combinations end up in the cache.
+    """
+    if scope:
+        fields_metadata = get_fields_metadata_by_scope(scope, dataset_type) or {}
+    else:
+        fields_metadata = get_all_fields_metadata(dataset_type)
+
+    return DatasetMetadataResponse.model_construct(
+        dataset_type=dataset_type,
+        fields={
+            field_name: _field_response(dataset_type, field_name)
+            for field_name in fields_metadata
+        },
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _metadata_json(dataset_type: str, scope: str | None) -> bytes:
+    """JSON body for a metadata response, serialized once per dataset type and scope."""
+    return _build_metadata_response(dataset_type, scope).model_dump_json().encode()
+
+
+@functools.lru_cache(maxsize=512)
+def _field_json(dataset_type: str, field_name: str) -> bytes:
+    """JSON body for a single field's metadata (field must exist)."""
+    return _field_response(dataset_type, field_name).model_dump_json().encode()
+
+
+# The dataset type registry is static, so the list response never changes
+_METADATA_LIST_JSON = (
+    MetadataListResponse(dataset_types=get_dataset_type_names()).model_dump_json().encode()
+)
+
+# Build the full (unscoped) metadata bodies up front so the first request
+# doesn't pay for them
+for _name in get_dataset_type_names():
+    _metadata_json(_name, None)
+
+
+@functools.lru_cache(maxsize=1024)
+def _etag(body: bytes) -> str:
+    """Strong ETag for a cached response body (bodies are reused, so hashed once)."""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    """Whether an If-None-Match header value matches `etag` (weak comparison)."""
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _json_response(body: bytes, request: Request) -> Response:
+    """
+    Return a cached JSON body with validators for HTTP caching.
+
+    Returning a Response skips FastAPI's response_model validation and
+    serialization; the models are still used for the OpenAPI schema.
+    Clients that send back the ETag get an empty 304.
+    """
+    etag = _etag(body)
+    headers = {
+        "ETag": etag,
+        # private: responses require an API key, so shared caches must not store them
+        "Cache-Control": f"private, max-age={get_settings().metadata_max_age}",
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(etag, if_none_match):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.get(
     "/metadata",
     response_model=MetadataListResponse,
@@ -34,6 +144,7 @@ router = APIRouter(tags=["Metadata"])
     description="Get a list of all available dataset types that have metadata available.",
 )
 async def list_dataset_types(
+    request: Request,
     _auth: AuthenticatedUser,
 ):
     """
@@ -48,10 +159,10 @@ async def list_dataset_types(
     Raises:
         401: If API key is missing or invalid
     """
-    dataset_types = get_all_dataset_types()
-    dataset_names = [ds_type.name for ds_type in dataset_types]
-    logger.info(f"Listed {len(dataset_names)} dataset types: {', '.join(dataset_names)}")
-    return MetadataListResponse(dataset_types=dataset_names)
+    if logger.isEnabledFor(logging.INFO):
+        dataset_names = get_dataset_type_names()
+        logger.info("Listed %d dataset types: %s", len(dataset_names), ", ".join(dataset_names))
+    return _json_response(_METADATA_LIST_JSON, request)
 
 
 @router.get(
@@ -61,6 +172,7 @@ async def list_dataset_types(
     description="Get detailed metadata for all fields in a dataset type, including descriptions, data types, units, and possible values.",
 )
 async def get_dataset_metadata(
+    request: Request,
     dataset_type: str,
     _auth: AuthenticatedUser,
     scope: str | None = Query(
@@ -94,54 +206,43 @@ async def get_dataset_metadata(
     # Validate dataset type exists
     ds_config = get_dataset_type(dataset_type)
     if ds_config is None:
-        available = [ds.name for ds in get_all_dataset_types()]
-        logger.warning(f"Dataset type '{dataset_type}' not found. Available: {', '.join(available)}")
+        available = ", ".join(get_dataset_type_names())
+        logger.warning("Dataset type '%s' not found. Available: %s", dataset_type, available)
         raise HTTPException(
             status_code=404,
-            detail=f"Dataset type '{dataset_type}' not found. Available types: {', '.join(available)}",
+            detail=f"Dataset type '{dataset_type}' not found. Available types: {available}",
         )
 
-    # Get metadata, optionally filtered by scope
+    # Validate scope if provided
     if scope:
-        fields_metadata = get_fields_metadata_by_scope(scope, dataset_type)
-        if fields_metadata is None:
-            from peskas_api.schema.scopes import get_available_scopes
-
-            available_scopes = get_available_scopes(dataset_type)
+        available_scopes = get_available_scopes(dataset_type)
+        if scope not in available_scopes:
+            available = ", ".join(available_scopes)
             logger.warning(
-                f"Invalid scope '{scope}' for dataset type '{dataset_type}'. "
-                f"Available scopes: {', '.join(available_scopes)}"
+                "Invalid scope '%s' for dataset type '%s'. Available scopes: %s",
+                scope,
+                dataset_type,
+                available,
             )
             raise HTTPException(
                 status_code=400,
-                detail=f"Invalid scope '{scope}' for dataset type '{dataset_type}'. Available scopes: {', '.join(available_scopes)}",
+                detail=f"Invalid scope '{scope}' for dataset type '{dataset_type}'. Available scopes: {available}",
             )
-        logger.info(f"Retrieved metadata for {len(fields_metadata)} fields in scope '{scope}' for dataset '{dataset_type}'")
+
+    response = _build_metadata_response(dataset_type, scope or None)
+    if scope:
+        logger.info(
+            "Retrieved metadata for %d fields in scope '%s' for dataset '%s'",
+            len(response.fields),
+            scope,
+            dataset_type,
+        )
     else:
-        fields_metadata = get_all_fields_metadata(dataset_type)
-        logger.info(f"Retrieved metadata for {len(fields_metadata)} fields for dataset '{dataset_type}'")
-
-    # Convert FieldMetadata dataclasses to Pydantic models
-    field_responses = {
-        field_name: FieldMetadataResponse(
-            name=metadata.name,
-            description=metadata.description,
-            data_type=metadata.data_type,
-            unit=metadata.unit,
-            possible_values=metadata.possible_values,
-            value_range=list(metadata.value_range) if metadata.value_range else None,
-            examples=metadata.examples,
-            required=metadata.required,
-            ontology_url=metadata.ontology_url,
-            url=metadata.url,
+        logger.info(
+            "Retrieved metadata for %d fields for dataset '%s'", len(response.fields), dataset_type
         )
-        for field_name, metadata in fields_metadata.items()
-    }
 
-    return DatasetMetadataResponse(
-        dataset_type=dataset_type,
-        fields=field_responses,
-    )
+    return _json_response(_metadata_json(dataset_type, scope or None), request)
 
 
 @router.get(
@@ -151,6 +252,7 @@ async def get_dataset_metadata(
     description="Get detailed metadata for a specific field in a dataset type.",
 )
 async def get_field_metadata_endpoint(
+    request: Request,
     dataset_type: str,
     field_name: str,
     _auth: AuthenticatedUser,
@@ -172,38 +274,29 @@ async def get_field_metadata_endpoint(
     # Validate dataset type exists
     ds_config = get_dataset_type(dataset_type)
     if ds_config is None:
-        available = [ds.name for ds in get_all_dataset_types()]
-        logger.warning(f"Dataset type '{dataset_type}' not found. Available: {', '.join(available)}")
+        available = ", ".join(get_dataset_type_names())
+        logger.warning("Dataset type '%s' not found. Available: %s", dataset_type, available)
         raise HTTPException(
             status_code=404,
-            detail=f"Dataset type '{dataset_type}' not found. Available types: {', '.join(available)}",
+            detail=f"Dataset type '{dataset_type}' not found. Available types: {available}",
         )
 
     # Get field metadata
     metadata = get_field_metadata(field_name, dataset_type)
     if metadata is None:
-        all_fields = get_all_fields_metadata(dataset_type)
-        available_fields = list(all_fields.keys())
+        available_fields = list_field_names(dataset_type)
         logger.warning(
-            f"Field '{field_name}' not found in dataset type '{dataset_type}'. "
-            f"Available fields: {', '.join(available_fields[:10])}{'...' if len(available_fields) > 10 else ''}"
+            "Field '%s' not found in dataset type '%s'. Available fields: %s%s",
+            field_name,
+            dataset_type,
+            ", ".join(available_fields[:10]),
+            "..." if len(available_fields) > 10 else "",
         )
         raise HTTPException(
             status_code=404,
             detail=f"Field '{field_name}' not found in dataset type '{dataset_type}'. Available fields: {', '.join(available_fields)}",
         )
 
-    logger.info(f"Retrieved metadata for field '{field_name}' in dataset '{dataset_type}'")
-
-    return FieldMetadataResponse(
-        name=metadata.name,
-        description=metadata.description,
-        data_type=metadata.data_type,
-        unit=metadata.unit,
-        possible_values=metadata.possible_values,
-        value_range=list(metadata.value_range) if metadata.value_range else None,
-        examples=metadata.examples,
-        required=metadata.required,
-        ontology_url=metadata.ontology_url,
-        url=metadata.url,
-    )
+    logger.info("Retrieved metadata for field '%s' in dataset '%s'", field_name, dataset_type)
+
+    return _json_response(_field_json(dataset_type, field_name), request)
@@ -4,7 +4,10 @@ Authentication via shared secret header.
 Simple but effective for internal/trusted clients.
 """
 
-from fastapi import HTTPException, Security
+import hashlib
+import hmac
+
+from fastapi import HTTPException, Request, Security
 from fastapi.security import APIKeyHeader
 from starlette.status import HTTP_401_UNAUTHORIZED, HTTP_403_FORBIDDEN
 
@@ -12,12 +15,50 @@ from peskas_api.core.config import get_settings
 
 settings = get_settings()
 
-api_key_header = APIKeyHeader(
+
+class ScopeAPIKeyHeader(APIKeyHeader):
+    """
+    APIKeyHeader that reads the key straight from the ASGI scope.
+
+    ASGI header names are already lowercased bytes, so finding the key is
+    one bytes comparison per header instead of a case-insensitive
+    `request.headers.get` lookup. OpenAPI output is unchanged.
+    """
+
+    def __init__(self, *, name: str, auto_error: bool = True):
+        super().__init__(name=name, scheme_name="APIKeyHeader", auto_error=auto_error)
+        self._raw_name = name.lower().encode("latin-1")
+
+    async def __call__(self, request: Request) -> str | None:
+        for header_name, value in request.scope["headers"]:
+            if header_name == self._raw_name:
+                return self._check(value.decode("latin-1"))
+        return self._check(None)
+
+    def _check(self, api_key: str | None) -> str | None:
+        """Missing-key handling as in APIKeyHeader (FastAPI < 0.116 has no check_api_key)."""
+        if not api_key:
+            if self.auto_error:
+                raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+            return None
+        return api_key
+
+
+api_key_header = ScopeAPIKeyHeader(
     name=settings.api_key_header_name,
     auto_error=False,
 )
 
 
+def _key_digest(key: str) -> bytes:
+    """Fixed-length digest of an API key, used for constant-time comparison."""
+    return hashlib.blake2b(key.encode(), digest_size=16).digest()
+
+
+# Computed once so each request only hashes the presented key
+_secret_digest = _key_digest(settings.api_secret_key)
+
+
 async def verify_api_key(
     api_key: str | None = Security(api_key_header),
 ) -> str:
@@ -36,7 +77,7 @@ async def verify_api_key(
             detail="Missing API key. Include X-API-Key header.",
         )
 
-    if api_key != settings.api_secret_key:
+    if not hmac.compare_digest(_key_digest(api_key), _secret_digest):
         raise HTTPException(
             status_code=HTTP_403_FORBIDDEN,
             detail="Invalid API key.",
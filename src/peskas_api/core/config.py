@@ -29,6 +29,8 @@ class Settings(BaseSettings):
     api_version: str = __version__  # Read from package metadata (pyproject.toml)
     api_prefix: str = "/api/v1"
     debug: bool = False
+    # Browser origins allowed by CORS outside debug mode (JSON list in env)
+    cors_origins: list[str] = []
 
     # === Authentication ===
     api_secret_key: str = Field(..., description="Shared secret for X-API-Key header")
@@ -37,6 +39,13 @@ class Settings(BaseSettings):
     # === GCS Configuration ===
     gcs_bucket_name: str = Field(..., description="GCS bucket containing parquet files")
     gcs_project_id: str | None = None
+    # Max pooled HTTP connections kept alive to the GCS API
+    gcs_http_pool_size: int = 32
+    # Seconds to reuse the latest-version lookup for a folder before listing again
+    gcs_latest_ttl: float = 60.0
+    # Files larger than twice this are downloaded as parallel ranged GETs
+    gcs_download_chunk_size: int = 32 * 1024 * 1024
+    gcs_download_workers: int = 8
 
     # === Data Layout ===
     # Pattern: {country}/{status}/ (files are versioned within folder)
@@ -55,11 +64,37 @@ class Settings(BaseSettings):
     max_rows_default: int = 100_000
     max_rows_limit: int = 1_000_000
 
+    # === Streaming ===
+    # Rows fetched from DuckDB per record batch when streaming responses
+    stream_batch_size: int = 65_536
+    # Bytes per chunk sent to the client when streaming CSV
+    stream_chunk_size: int = 131_072
+
+    # === DuckDB ===
+    # Worker threads shared by all queries (None = DuckDB's default, one per CPU core)
+    duckdb_threads: int | None = None
+
+    # === Compression ===
+    # Responses smaller than this many bytes are sent uncompressed
+    gzip_minimum_size: int = 1024
+    # zlib level 1-9; lower trades ratio for CPU on large CSV downloads
+    gzip_compresslevel: int = 5
+
+    # === Response Cache ===
+    # Cache-Control max-age (seconds) sent with metadata responses
+    metadata_max_age: int = 300
+
+    # === Health Check ===
+    # Seconds to reuse the last GCS connectivity probe
+    health_cache_ttl: float = 5.0
+    # Create GCS/DuckDB clients in the background at startup
+    warm_up_on_startup: bool = True
+
     # === Temporary Storage ===
     temp_dir: str = "/tmp/peskas_cache"
 
 
-@lru_cache
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get cached settings instance."""
+    """Get cached settings instance (environment is parsed once per process)."""
     return Settings()
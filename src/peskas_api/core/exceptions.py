@@ -3,7 +3,8 @@
 import logging
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+
+from peskas_api.core.responses import ORJSONResponse
 
 logger = logging.getLogger(__name__)
 
@@ -25,11 +26,15 @@ def register_exception_handlers(app: FastAPI) -> None:
 
     @app.exception_handler(DataNotFoundError)
     async def data_not_found_handler(request: Request, exc: DataNotFoundError):
+        # Lazy %-formatting with the raw query string from the ASGI scope,
+        # so no URL or QueryParams object is parsed just to log
         logger.warning(
-            f"DataNotFoundError: {exc} - Path: {request.url.path} "
-            f"Query: {dict(request.query_params)}"
+            "DataNotFoundError: %s - Path: %s Query: %s",
+            exc,
+            request.scope["path"],
+            request.scope["query_string"].decode("latin-1"),
         )
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=404,
             content={"detail": str(exc)},
         )
@@ -40,7 +45,7 @@ def register_exception_handlers(app: FastAPI) -> None:
             f"SchemaError: {exc} - Path: {request.url.path}",
             exc_info=True
         )
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={"detail": f"Schema error: {exc}"},
         )
@@ -0,0 +1,86 @@
+"""
+Logging configuration.
+
+Log records are handed to a queue and written by a background thread, so
+request handlers never block on stream I/O when they log.
+"""
+
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Records held while the writer thread catches up; beyond this they are dropped
+LOG_QUEUE_SIZE = 10_000
+
+_listener: QueueListener | None = None
+_listener_running = False
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler for a bounded queue that drops records when it is full.
+
+    A slow or blocked log sink must never apply backpressure to request
+    handlers, so overflow is counted instead of blocking or raising.
+    """
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def configure_logging(level: int = logging.INFO, queue_size: int = LOG_QUEUE_SIZE) -> None:
+    """
+    Route root logger output through a bounded queue to a stderr handler.
+
+    The listener thread is started immediately so records emitted before
+    the application lifespan begins are still written. Calling this again
+    (e.g. when the app module is re-imported) is a no-op.
+    """
+    global _listener
+
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.handlers = [DroppingQueueHandler(log_queue)]
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    start_logging()
+
+
+def start_logging() -> None:
+    """Start the background log writer if it is not already running."""
+    global _listener_running
+
+    if _listener is not None and not _listener_running:
+        _listener.start()
+        _listener_running = True
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the background log writer."""
+    global _listener_running
+
+    if _listener is not None and _listener_running:
+        for handler in logging.getLogger().handlers:
+            if isinstance(handler, DroppingQueueHandler) and handler.dropped:
+                logging.getLogger(__name__).warning(
+                    "Dropped %d log records because the log queue was full",
+                    handler.dropped,
+                )
+        _listener.stop()
+        _listener_running = False
@@ -0,0 +1,72 @@
+"""
+ASGI middleware.
+
+Written as plain ASGI callables rather than `@app.middleware("http")`
+functions, which Starlette wraps in BaseHTTPMiddleware (an extra task and
+Request/Response objects per request, and a proxied response body stream).
+"""
+
+import logging
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+_PROCESS_TIME_HEADER = b"x-process-time"
+
+
+class RequestLoggingMiddleware:
+    """Log every HTTP request with its status and duration.
+
+    Also adds an `X-Process-Time` header (seconds) to the response.
+    Requests for `skip_paths` (health probes, API docs) are passed through
+    untouched: they are frequent and carry no useful log data.
+    """
+
+    def __init__(self, app: ASGIApp, skip_paths: frozenset[str] = frozenset()) -> None:
+        self.app = app
+        self.skip_paths = skip_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.perf_counter_ns()
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
+
+        logger.info(
+            "Request: %s %s client=%s", method, path, client[0] if client else "unknown"
+        )
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                elapsed_ns = time.perf_counter_ns() - start_ns
+                logger.info(
+                    "Response: %s %s status=%s duration=%dms",
+                    method,
+                    path,
+                    message["status"],
+                    elapsed_ns // 1_000_000,
+                )
+                headers = list(message.get("headers", []))
+                headers.append((_PROCESS_TIME_HEADER, str(elapsed_ns / 1e9).encode()))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            logger.error(
+                "Error: %s %s exception=%s duration=%dms",
+                method,
+                path,
+                type(e).__name__,
+                elapsed_ns // 1_000_000,
+                exc_info=True,
+            )
+            raise
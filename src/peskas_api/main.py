@@ -4,40 +4,94 @@ FastAPI application entry point.
 This is the main module that creates and configures the FastAPI app.
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
-import time
-
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
-from peskas_api.api.router import api_router
-from peskas_api.core.config import get_settings
+from peskas_api.core.config import Settings, get_settings
 from peskas_api.core.exceptions import register_exception_handlers
+from peskas_api.core.logging import configure_logging, start_logging, stop_logging
+from peskas_api.core.middleware import RequestLoggingMiddleware
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+# Configure logging (records are written by a background thread)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 
+def _warm_up() -> None:
+    """
+    Create the service singletons and open a first GCS connection.
+
+    Without this the first data request pays for GCS credential discovery,
+    the TLS handshake and DuckDB initialisation. Failures are only logged:
+    the request path retries and reports them properly.
+    """
+    import duckdb
+
+    from peskas_api.services.gcs import gcs_errors, get_gcs_service
+    from peskas_api.services.query import get_query_service
+
+    try:
+        get_query_service()
+        get_gcs_service().bucket.exists()
+        logger.info("Warm-up complete: GCS and DuckDB ready")
+    except (duckdb.Error, *gcs_errors()) as e:
+        logger.warning(f"Warm-up failed, continuing without it: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler for startup/shutdown."""
+    start_logging()
     try:
-        settings = get_settings()
+        settings = app.state.settings
         logger.info(f"Starting {settings.api_title} v{settings.api_version}")
         logger.info(f"GCS Bucket: {settings.gcs_bucket_name}")
     except Exception as e:
         logger.error(f"Failed to load settings during startup: {e}", exc_info=True)
         raise
 
+    # Warm up in the background so startup is not delayed by GCS auth
+    warm_up_task = None
+    if settings.warm_up_on_startup:
+        warm_up_task = asyncio.create_task(run_in_threadpool(_warm_up))
+
     yield
 
     logger.info("Shutting down...")
+    # The warm-up thread can't be interrupted; let it finish so the process
+    # doesn't exit while it is still inside native GCS/DuckDB code
+    if warm_up_task is not None:
+        await warm_up_task
+    stop_logging()
+
+
+def _cors_kwargs(settings: Settings) -> dict | None:
+    """
+    CORSMiddleware options, or None if CORS should not be enabled.
+
+    Debug mode allows any origin. Otherwise only CORS_ORIGINS are allowed,
+    for read-only requests carrying the API key header.
+    """
+    if settings.debug:
+        return {
+            "allow_origins": ["*"],
+            "allow_credentials": True,
+            "allow_methods": ["*"],
+            "allow_headers": ["*"],
+        }
+    if settings.cors_origins:
+        return {
+            "allow_origins": list(settings.cors_origins),
+            "allow_methods": ["GET"],
+            "allow_headers": [settings.api_key_header_name],
+        }
+    return None
 
 
 def create_app() -> FastAPI:
@@ -74,62 +128,56 @@ By default, data is returned as CSV. Use `format=json` for JSON output.
         docs_url="/docs",
         redoc_url="/redoc",
     )
-
-    # CORS (configure appropriately for production)
-    if settings.debug:
-        app.add_middleware(
-            CORSMiddleware,
-            allow_origins=["*"],
-            allow_credentials=True,
-            allow_methods=["*"],
-            allow_headers=["*"],
-        )
+    # Resolved once here; lifespan and handlers with app access reuse it
+    app.state.settings = settings
 
     # Register exception handlers
     register_exception_handlers(app)
 
-    # Request logging middleware
-    @app.middleware("http")
-    async def log_requests(request: Request, call_next):
-        """Log all requests with timing and status."""
-        start_time = time.time()
-        
-        # Log request
-        logger.info(
-            f"Request: {request.method} {request.url.path} "
-            f"client={request.client.host if request.client else 'unknown'}"
-        )
-        
-        try:
-            response = await call_next(request)
-            process_time = time.time() - start_time
-            
-            # Log response
-            logger.info(
-                f"Response: {request.method} {request.url.path} "
-                f"status={response.status_code} duration={process_time:.3f}s"
-            )
-            
-            # Add timing header
-            response.headers["X-Process-Time"] = str(process_time)
-            return response
-            
-        except Exception as e:
-            process_time = time.time() - start_time
-            logger.error(
-                f"Error: {request.method} {request.url.path} "
-                f"exception={type(e).__name__} duration={process_time:.3f}s",
-                exc_info=True
-            )
-            raise
-
-    # Mount API routes
+    # Compress responses for clients sending Accept-Encoding: gzip.
+    # Added before the logging middleware so it runs inside it.
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=settings.gzip_minimum_size,
+        compresslevel=settings.gzip_compresslevel,
+    )
+
+    # Request logging middleware (health probes and docs are not logged)
+    app.add_middleware(
+        RequestLoggingMiddleware,
+        skip_paths=frozenset(
+            {
+                f"{settings.api_prefix}/health",
+                "/docs",
+                "/docs/oauth2-redirect",
+                "/redoc",
+                "/openapi.json",
+                "/favicon.ico",
+            }
+        ),
+    )
+
+    # CORS: only installed when there are origins to allow, so ordinary
+    # API traffic doesn't pass through the CORS middleware at all. Added
+    # last so it is outermost: preflights are answered first and every
+    # response, compressed or not, gets the caller's own CORS headers.
+    cors_kwargs = _cors_kwargs(settings)
+    if cors_kwargs is not None:
+        app.add_middleware(CORSMiddleware, **cors_kwargs)
+
+    # Mount API routes (imported here: pulls in every endpoint and service module)
+    from peskas_api.api.router import api_router
+
     try:
         app.include_router(api_router, prefix=settings.api_prefix)
     except Exception as e:
         logger.error(f"Failed to mount API routes: {e}", exc_info=True)
         raise
 
+    # Build the OpenAPI schema now; FastAPI caches it on app.openapi_schema,
+    # so the first /docs or /openapi.json request doesn't pay for it
+    app.openapi()
+
     return app
 
 
@@ -7,9 +7,10 @@ Pydantic models for validating and documenting API parameters.
 from datetime import date
 from typing import Annotated
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from peskas_api.models.enums import DatasetStatus, ResponseFormat
+from peskas_api.schema.scopes import get_available_scopes, get_scope_columns
 
 
 class DatasetQueryParams(BaseModel):
@@ -19,11 +20,17 @@ class DatasetQueryParams(BaseModel):
     These parameters apply to all dataset type endpoints.
     """
 
+    # Parameters are read-only once parsed; whitespace is stripped by
+    # pydantic-core rather than in a Python validator
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     country: Annotated[
         str,
         Field(
             min_length=2,
             max_length=50,
+            # Also used in GCS prefixes and local cache file names
+            pattern=r"^[a-z_]+$",
             description="Country identifier (e.g., 'zanzibar')",
             examples=["zanzibar"],
         ),
@@ -118,11 +125,11 @@ class DatasetQueryParams(BaseModel):
         ),
     ] = ResponseFormat.CSV
 
-    @field_validator("country")
+    @field_validator("country", mode="before")
     @classmethod
-    def normalize_country(cls, v: str) -> str:
-        """Normalize country identifier to lowercase."""
-        return v.lower()
+    def normalize_country(cls, v: object) -> object:
+        """Normalize country identifier to lowercase (before type/length checks)."""
+        return v.lower() if isinstance(v, str) else v
 
     @model_validator(mode="after")
     def validate_date_range(self) -> "DatasetQueryParams":
@@ -132,7 +139,7 @@ class DatasetQueryParams(BaseModel):
                 raise ValueError("date_to must be >= date_from")
         return self
 
-    def get_columns(self, dataset_type: str = "landings") -> list[str] | None:
+    def get_columns(self, dataset_type: str = "landings") -> tuple[str, ...] | None:
         """
         Resolve columns from scope parameter.
 
@@ -142,8 +149,6 @@ class DatasetQueryParams(BaseModel):
             ValueError: If scope is invalid or not found
         """
         if self.scope:
-            from peskas_api.schema.scopes import get_scope_columns, get_available_scopes
-
             columns = get_scope_columns(self.scope, dataset_type)
             if columns is None:
                 available = get_available_scopes(dataset_type)
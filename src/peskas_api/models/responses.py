@@ -1,9 +1,12 @@
 """Response schemas."""
 
+from collections.abc import Sequence
 from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
+from peskas_api.schema.field_metadata import FieldDataType, ValueRange
+
 
 class HealthResponse(BaseModel):
     """Health check response."""
@@ -30,22 +33,22 @@ class FieldMetadataResponse(BaseModel):
 
     name: str = Field(description="Field/column name")
     description: str = Field(description="Human-readable description of the field")
-    data_type: str = Field(
+    data_type: FieldDataType = Field(
         description="Data type: 'string', 'integer', 'float', 'date', or 'datetime'"
     )
     unit: str | None = Field(
         default=None,
         description="Unit of measurement (e.g., 'kg', 'cm', 'hours')"
     )
-    possible_values: list[str] | None = Field(
+    possible_values: Sequence[str] | None = Field(
         default=None,
         description="List of possible values for categorical/enum fields"
     )
-    value_range: list[float | None] | None = Field(
+    value_range: ValueRange | None = Field(
         default=None,
         description="Minimum and maximum values for numeric fields as [min, max] (null indicates unbounded)"
     )
-    examples: list[Any] | None = Field(
+    examples: Sequence[Any] | None = Field(
         default=None,
         description="Example values for this field"
     )
@@ -6,6 +6,7 @@ types are added or names change, only this file needs updating.
 """
 
 from dataclasses import dataclass
+from functools import cache
 
 
 @dataclass
@@ -20,7 +21,7 @@ class DatasetType:
 
 # === Dataset Type Registry ===
 # Add new dataset types here. The API router will automatically
-# pick them up and create endpoints.
+# serve them under their endpoint path segment.
 #
 # Note: Trip data is included in the landings dataset (wide format)
 # so there is only one dataset type.
@@ -40,6 +41,23 @@ def get_dataset_type(name: str) -> DatasetType | None:
     return DATASET_TYPES.get(name)
 
 
-def get_all_dataset_types() -> list[DatasetType]:
-    """Get all registered dataset types."""
-    return list(DATASET_TYPES.values())
+def get_dataset_type_by_endpoint(endpoint: str) -> DatasetType | None:
+    """Get dataset type by its API endpoint path segment."""
+    return _dataset_types_by_endpoint().get(endpoint)
+
+
+@cache
+def _dataset_types_by_endpoint() -> dict[str, DatasetType]:
+    return {ds_type.endpoint: ds_type for ds_type in DATASET_TYPES.values()}
+
+
+@cache
+def get_all_dataset_types() -> tuple[DatasetType, ...]:
+    """Get all registered dataset types (cached; the registry is static)."""
+    return tuple(DATASET_TYPES.values())
+
+
+@cache
+def get_dataset_type_names() -> tuple[str, ...]:
+    """Get names of all registered dataset types (cached)."""
+    return tuple(ds_type.name for ds_type in get_all_dataset_types())
@@ -9,11 +9,26 @@ To add or modify field metadata, update the FIELD_METADATA dictionary below.
 Each dataset type can have its own set of field definitions.
 """
 
-from dataclasses import dataclass
-from typing import Any
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, fields, replace
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, ClassVar, Literal, NamedTuple
 
+from peskas_api.schema.scopes import SCOPE_DEFINITIONS
 
-@dataclass
+# Values allowed for FieldMetadata.data_type
+FieldDataType = Literal["string", "integer", "float", "date", "datetime"]
+
+
+class ValueRange(NamedTuple):
+    """(min, max) bounds of a numeric field; None means unbounded."""
+
+    min: float | None
+    max: float | None
+
+
+@dataclass(slots=True, frozen=True)
 class FieldMetadata:
     """Metadata for a single data field/column.
 
@@ -23,13 +38,11 @@ class FieldMetadata:
 
     name: str
     description: str
-    data_type: str  # "string", "integer", "float", "date", "datetime"
+    data_type: FieldDataType
     unit: str | None = None  # e.g., "kg", "cm", "hours"
-    possible_values: list[str] | None = None  # For enum/categorical fields
-    value_range: tuple[float | None, float | None] | None = (
-        None  # (min, max) for numeric ranges
-    )
-    examples: list[Any] | None = None
+    possible_values: Sequence[str] | None = None  # For enum/categorical fields
+    value_range: ValueRange | None = None  # (min, max) for numeric ranges
+    examples: Sequence[Any] | None = None
     required: bool = False
     ontology_url: str | None = (
         None  # URL to formal ontology definition (e.g., AQFO, schema.org)
@@ -38,6 +51,16 @@ class FieldMetadata:
         None  # URL to reference documentation (e.g., FAO ASFIS catalog, GAUL dataset)
     )
 
+    # Field names in definition order, set below the class
+    _FIELD_NAMES: ClassVar[tuple[str, ...]]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Shallow dict of all fields (unlike dataclasses.asdict, no deep copy)."""
+        return {name: getattr(self, name) for name in self._FIELD_NAMES}
+
+
+FieldMetadata._FIELD_NAMES = tuple(f.name for f in fields(FieldMetadata))
+
 
 # Field metadata per dataset type
 # Format: {dataset_type: {field_name: FieldMetadata}}
@@ -101,7 +124,7 @@ FIELD_METADATA: dict[str, dict[str, FieldMetadata]] = {
             name="n_fishers",
             description="The total number of people actively fishing on a fishing trip",
             data_type="integer",
-            value_range=(1, None),
+            value_range=ValueRange(1, None),
             examples=[1, 2, 3, 4, 5],
             ontology_url="http://w3id.org/aqfo/aqfo_00000022",
         ),
@@ -110,7 +133,7 @@ FIELD_METADATA: dict[str, dict[str, FieldMetadata]] = {
             description="Refers to the duration of fishing, measured in time (normally days or hours) between departure and return time and date.",
             data_type="float",
             unit="hours",
-            value_range=(0.0, None),
+            value_range=ValueRange(0.0, None),
             examples=[4.5, 6.0, 8.5, 12.0],
             ontology_url="http://w3id.org/aqfo/aqfo_00002011",
         ),
@@ -161,7 +184,7 @@ FIELD_METADATA: dict[str, dict[str, FieldMetadata]] = {
                 "different length classes (e.g., 10–15 cm and 20–25 cm) count as two catches."
             ),
             data_type="integer",
-            value_range=(0, None),
+            value_range=ValueRange(0, None),
             examples=[0, 1, 3, 10],
         ),
         "scientific_name": FieldMetadata(
@@ -200,7 +223,7 @@ FIELD_METADATA: dict[str, dict[str, FieldMetadata]] = {
             ),
             data_type="float",
             unit="cm",
-            value_range=(0.0, None),
+            value_range=ValueRange(0.0, None),
             examples=[10.0, 15.0, 30.0, 90.0, 110.0, 145.0, 200.0],
             ontology_url="http://w3id.org/aqfo/aqfo_00002073",
         ),
@@ -209,7 +232,7 @@ FIELD_METADATA: dict[str, dict[str, FieldMetadata]] = {
             description="Weight of the catch in kilograms",
             data_type="float",
             unit="kg",
-            value_range=(0.0, None),
+            value_range=ValueRange(0.0, None),
             examples=[15.5, 45.2, 120.0, 250.5],
         ),
         "catch_price": FieldMetadata(
@@ -217,7 +240,7 @@ FIELD_METADATA: dict[str, dict[str, FieldMetadata]] = {
             description="Price of the catch in local currency. Currency unit depends on the country",
             data_type="float",
             unit="local_currency",
-            value_range=(0.0, None),
+            value_range=ValueRange(0.0, None),
             examples=[30000, 50000, 200000],
             ontology_url="http://w3id.org/aqfo/aqfo_00002015",
         ),
@@ -227,7 +250,7 @@ FIELD_METADATA: dict[str, dict[str, FieldMetadata]] = {
             description="Total weight of all catches for the entire fishing trip in kilograms. This is the sum of all catch_kg values for the trip.",
             data_type="float",
             unit="kg",
-            value_range=(0.0, None),
+            value_range=ValueRange(0.0, None),
             examples=[30.0, 872.0, 26.0, 10.0, 60.0, 70.0],
         ),
         "tot_catch_price": FieldMetadata(
@@ -235,13 +258,58 @@ FIELD_METADATA: dict[str, dict[str, FieldMetadata]] = {
             description="Total price of all catches for the entire fishing trip in local currency. This is the sum of all catch_price values for the trip. Currency unit depends on the country.",
             data_type="float",
             unit="local_currency",
-            value_range=(0.0, None),
+            value_range=ValueRange(0.0, None),
             examples=[2900, 109, 6500, 1700, 5000, 3200],
         ),
     },
 }
 
 
+# Identical value lists across fields are stored once, as shared tuples
+_INTERNED_SEQUENCES: dict[tuple, tuple] = {}
+
+
+def _intern_seq(values: Sequence[Any] | None) -> tuple | None:
+    """Return a shared tuple equal to `values` (element types included)."""
+    if values is None:
+        return None
+    values = tuple(values)
+    # Key on types too so that e.g. (1, 2) and (1.0, 2.0) stay distinct
+    key = tuple((type(v), v) for v in values)
+    return _INTERNED_SEQUENCES.setdefault(key, values)
+
+
+for _fields in FIELD_METADATA.values():
+    for _name, _metadata in _fields.items():
+        _fields[_name] = replace(
+            _metadata,
+            possible_values=_intern_seq(_metadata.possible_values),
+            examples=_intern_seq(_metadata.examples),
+        )
+del _fields, _name, _metadata
+
+
+# Read-only views of FIELD_METADATA, built once; returned without copying
+_FROZEN_FIELD_METADATA: dict[str, Mapping[str, FieldMetadata]] = {
+    dataset_type: MappingProxyType(fields)
+    for dataset_type, fields in FIELD_METADATA.items()
+}
+_EMPTY_FIELD_METADATA: Mapping[str, FieldMetadata] = MappingProxyType({})
+
+# Per-(dataset_type, scope) projections of FIELD_METADATA, built once
+_SCOPE_FIELD_METADATA: dict[tuple[str, str], Mapping[str, FieldMetadata]] = {
+    (dataset_type, scope): MappingProxyType(
+        {
+            col: _FROZEN_FIELD_METADATA[dataset_type][col]
+            for col in columns
+            if col in _FROZEN_FIELD_METADATA.get(dataset_type, _EMPTY_FIELD_METADATA)
+        }
+    )
+    for dataset_type, scopes in SCOPE_DEFINITIONS.items()
+    for scope, columns in scopes.items()
+}
+
+
 def get_field_metadata(
     field_name: str,
     dataset_type: str = "landings",
@@ -262,7 +330,7 @@ def get_field_metadata(
 
 def get_all_fields_metadata(
     dataset_type: str = "landings",
-) -> dict[str, FieldMetadata]:
+) -> Mapping[str, FieldMetadata]:
     """
     Get metadata for all fields in a dataset type.
 
@@ -270,15 +338,29 @@ def get_all_fields_metadata(
         dataset_type: Dataset type name
 
     Returns:
-        Dictionary mapping field names to FieldMetadata objects
+        Read-only mapping of field names to FieldMetadata objects
     """
-    return FIELD_METADATA.get(dataset_type, {}).copy()
+    return _FROZEN_FIELD_METADATA.get(dataset_type, _EMPTY_FIELD_METADATA)
+
+
+@lru_cache
+def list_field_names(dataset_type: str = "landings") -> tuple[str, ...]:
+    """
+    Get the names of all fields in a dataset type (cached).
+
+    Args:
+        dataset_type: Dataset type name
+
+    Returns:
+        Tuple of field names, in definition order
+    """
+    return tuple(FIELD_METADATA.get(dataset_type, {}))
 
 
 def get_fields_metadata_by_scope(
     scope: str,
     dataset_type: str = "landings",
-) -> dict[str, FieldMetadata] | None:
+) -> Mapping[str, FieldMetadata] | None:
     """
     Get metadata for fields in a specific scope.
 
@@ -287,13 +369,6 @@ def get_fields_metadata_by_scope(
         dataset_type: Dataset type name
 
     Returns:
-        Dictionary mapping field names to FieldMetadata objects, or None if scope not found
+        Read-only mapping of field names to FieldMetadata objects, or None if scope not found
     """
-    from peskas_api.schema.scopes import get_scope_columns
-
-    columns = get_scope_columns(scope, dataset_type)
-    if columns is None:
-        return None
-
-    all_metadata = get_all_fields_metadata(dataset_type)
-    return {col: all_metadata[col] for col in columns if col in all_metadata}
+    return _SCOPE_FIELD_METADATA.get((dataset_type, scope))
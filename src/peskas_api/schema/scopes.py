@@ -9,19 +9,19 @@ Each dataset type can have its own set of scopes.
 """
 
 # Scope definitions per dataset type
-# Format: {dataset_type: {scope_name: [column_list]}}
+# Format: {dataset_type: {scope_name: (column, ...)}}
 # 
 # To add a new scope, add it to the appropriate dataset type dictionary.
 # Example:
 #   "landings": {
-#       "trip_info": [...],
-#       "catch_info": [...],
-#       "my_new_scope": ["column1", "column2", ...],
+#       "trip_info": (...),
+#       "catch_info": (...),
+#       "my_new_scope": ("column1", "column2", ...),
 #   }
 
-SCOPE_DEFINITIONS: dict[str, dict[str, list[str]]] = {
+SCOPE_DEFINITIONS: dict[str, dict[str, tuple[str, ...]]] = {
     "landings": {
-        "trip_info": [
+        "trip_info": (
             # Trip-level information
             "survey_id",
             "trip_id",
@@ -38,8 +38,8 @@ SCOPE_DEFINITIONS: dict[str, dict[str, list[str]]] = {
             "catch_outcome",
             "tot_catch_kg",      # Trip-level aggregate: total catch weight
             "tot_catch_price",   # Trip-level aggregate: total catch price
-        ],
-        "catch_info": [
+        ),
+        "catch_info": (
             # Catch-level information
             "survey_id",
             "trip_id",
@@ -49,7 +49,7 @@ SCOPE_DEFINITIONS: dict[str, dict[str, list[str]]] = {
             "length_cm",
             "catch_kg",
             "catch_price",
-        ],
+        ),
     },
 }
 
@@ -57,7 +57,7 @@ SCOPE_DEFINITIONS: dict[str, dict[str, list[str]]] = {
 def get_scope_columns(
     scope: str,
     dataset_type: str = "landings",
-) -> list[str] | None:
+) -> tuple[str, ...] | None:
     """
     Get column list for a scope.
 
@@ -66,12 +66,18 @@ def get_scope_columns(
         dataset_type: Dataset type name
 
     Returns:
-        List of column names, or None if scope not found
+        Tuple of column names (shared, immutable), or None if scope not found
     """
     type_scopes = SCOPE_DEFINITIONS.get(dataset_type, {})
     return type_scopes.get(scope)
 
 
-def get_available_scopes(dataset_type: str = "landings") -> list[str]:
-    """Get list of available scope names for a dataset type."""
-    return list(SCOPE_DEFINITIONS.get(dataset_type, {}).keys())
+# Scope names per dataset type, built once (the registry is static)
+_AVAILABLE_SCOPES: dict[str, tuple[str, ...]] = {
+    dataset_type: tuple(scopes) for dataset_type, scopes in SCOPE_DEFINITIONS.items()
+}
+
+
+def get_available_scopes(dataset_type: str = "landings") -> tuple[str, ...]:
+    """Get names of available scopes for a dataset type."""
+    return _AVAILABLE_SCOPES.get(dataset_type, ())
@@ -7,20 +7,32 @@ are isolated here so storage changes don't ripple through the codebase.
 Updated: 2026-01-21 to support versioned parquet files with timestamps
 """
 
+import glob
 import hashlib
 import logging
+import os
 import re
+import threading
+import time
+import uuid
 from pathlib import Path
-
-from google.cloud import storage
-from google.cloud.exceptions import NotFound
+from typing import TYPE_CHECKING
 
 from peskas_api.core.config import get_settings
 from peskas_api.core.exceptions import DataNotFoundError
 from peskas_api.models.enums import DatasetStatus
 
+if TYPE_CHECKING:
+    # google-cloud-storage takes ~0.2s to import; it is loaded on first use
+    # instead so it doesn't add to container cold-start time
+    from google.cloud import storage
+
 logger = logging.getLogger(__name__)
 
+# Version part of a cached file name after "{country}_{status}_": the file's
+# timestamp, or a filename hash when the timestamp could not be parsed
+_CACHE_VERSION_RE = re.compile(r"(?:\d+|[0-9a-f]{8})\.parquet")
+
 
 class GCSService:
     """Service for accessing Parquet files in GCS."""
@@ -29,7 +41,16 @@ class GCSService:
         settings = get_settings()
         self.bucket_name = settings.gcs_bucket_name
         self.path_template = settings.gcs_path_template
+        self._filename_re = re.compile(settings.gcs_filename_pattern)
         self.temp_dir = Path(settings.temp_dir)
+        self.latest_ttl = settings.gcs_latest_ttl
+        self.download_chunk_size = settings.gcs_download_chunk_size
+        self.download_workers = settings.gcs_download_workers
+        # prefix -> (expires_at, latest blob path)
+        self._latest_cache: dict[str, tuple[float, str]] = {}
+        # cache_key -> lock while a download is in progress, so concurrent
+        # misses share one download
+        self._download_locks: dict[str, threading.Lock] = {}
         
         # Ensure temp directory exists and is writable
         try:
@@ -38,25 +59,43 @@ class GCSService:
             test_file = self.temp_dir / ".write_test"
             test_file.touch()
             test_file.unlink()
-            logger.debug(f"Temp directory ready: {self.temp_dir}")
+            logger.debug("Temp directory ready: %s", self.temp_dir)
         except (OSError, PermissionError) as e:
-            logger.error(f"Failed to create or access temp directory {self.temp_dir}: {e}")
+            logger.error("Failed to create or access temp directory %s: %s", self.temp_dir, e)
             raise RuntimeError(f"Temp directory not accessible: {self.temp_dir}") from e
 
         self._client: storage.Client | None = None
+        self._bucket: storage.Bucket | None = None
 
     @property
-    def client(self) -> storage.Client:
-        """Lazy-load GCS client."""
+    def client(self) -> "storage.Client":
+        """
+        Lazy-load GCS client.
+
+        The client's authorized session is given a larger connection pool
+        so concurrent requests reuse kept-alive TLS connections instead of
+        opening new ones once the default pool of 10 is exhausted.
+        """
         if self._client is None:
+            from google.cloud import storage
+            from requests.adapters import HTTPAdapter
+
             settings = get_settings()
-            self._client = storage.Client(project=settings.gcs_project_id)
+            client = storage.Client(project=settings.gcs_project_id)
+            adapter = HTTPAdapter(
+                pool_connections=settings.gcs_http_pool_size,
+                pool_maxsize=settings.gcs_http_pool_size,
+            )
+            client._http.mount("https://", adapter)
+            self._client = client
         return self._client
 
     @property
-    def bucket(self) -> storage.Bucket:
-        """Get bucket reference."""
-        return self.client.bucket(self.bucket_name)
+    def bucket(self) -> "storage.Bucket":
+        """Get bucket reference (created once and reused)."""
+        if self._bucket is None:
+            self._bucket = self.client.bucket(self.bucket_name)
+        return self._bucket
 
     def _parse_timestamp_from_filename(self, filename: str) -> int | None:
         """
@@ -71,14 +110,16 @@ class GCSService:
         Returns:
             Timestamp as integer (YYYYMMDDHHMMSS format), or None if pattern doesn't match
         """
-        settings = get_settings()
-        match = re.match(settings.gcs_filename_pattern, filename)
+        match = self._filename_re.match(filename)
         return int(match.group(1)) if match else None
 
     def _get_latest_file(self, prefix: str, status: DatasetStatus) -> str:
         """
         Find latest versioned file in GCS folder.
 
+        The result is reused for `gcs_latest_ttl` seconds, so repeated
+        requests for the same dataset don't each pay for a GCS LIST call.
+
         Args:
             prefix: GCS folder path (e.g., "zanzibar/raw/")
             status: DatasetStatus enum
@@ -89,25 +130,32 @@ class GCSService:
         Raises:
             DataNotFoundError: If no files found matching pattern
         """
+        now = time.monotonic()
+        cached = self._latest_cache.get(prefix)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
         blobs = self.bucket.list_blobs(prefix=prefix)
 
-        # Filter by pattern and parse timestamps
-        versioned_files = []
+        # Keep the newest matching file in a single pass (ties broken by
+        # filename, then full path, as a descending sort would)
+        latest: tuple[int, str, str] | None = None
         for blob in blobs:
-            filename = blob.name.split("/")[-1]
+            filename = blob.name.rpartition("/")[2]
             timestamp = self._parse_timestamp_from_filename(filename)
             if timestamp:
-                versioned_files.append((timestamp, filename, blob.name))
+                candidate = (timestamp, filename, blob.name)
+                if latest is None or candidate > latest:
+                    latest = candidate
 
-        if not versioned_files:
+        if latest is None:
             raise DataNotFoundError(
                 f"No data files found in gs://{self.bucket_name}/{prefix}"
             )
 
-        # Sort by timestamp (descending) and return latest
-        versioned_files.sort(reverse=True)
-        latest_timestamp, latest_filename, latest_path = versioned_files[0]
+        latest_path = latest[2]
 
+        self._latest_cache[prefix] = (now + self.latest_ttl, latest_path)
         return latest_path
 
     def build_object_path(
@@ -152,6 +200,15 @@ class GCSService:
         """
         folder_path = self.build_object_path(country, status)
 
+        # The in-memory lookup is cheapest; the local copy check (a directory
+        # glob) only runs when this process has no fresh lookup
+        cached = self._latest_cache.get(folder_path)
+        if cached is None or cached[0] <= time.monotonic():
+            local_copy = self._recent_local_copy(country, status)
+            if local_copy is not None:
+                logger.debug("Using recently downloaded file: %s", local_copy)
+                return local_copy
+
         # Find latest versioned file
         try:
             latest_file_path = self._get_latest_file(folder_path, status)
@@ -169,7 +226,10 @@ class GCSService:
         # Create deterministic local path for caching (include version)
         # Handle case where timestamp cannot be parsed (fallback to filename hash)
         if timestamp is None:
-            logger.warning(f"Could not parse timestamp from filename: {filename}, using filename as cache key")
+            logger.warning(
+                "Could not parse timestamp from filename: %s, using filename as cache key",
+                filename,
+            )
             # Use filename hash as fallback to ensure uniqueness
             filename_hash = hashlib.md5(filename.encode()).hexdigest()[:8]
             cache_key = f"{country}_{status.value}_{filename_hash}"
@@ -178,21 +238,149 @@ class GCSService:
         local_path = self.temp_dir / f"{cache_key}.parquet"
 
         # Download if not already cached
-        if not local_path.exists():
+        if local_path.exists():
+            logger.debug("Using cached file: %s", local_path)
+            return local_path
+
+        # Only created on a miss, and dropped once the download is done
+        lock = self._download_locks.get(cache_key) or self._download_locks.setdefault(
+            cache_key, threading.Lock()
+        )
+        with lock:
             try:
-                logger.info(f"Downloading {latest_file_path} from GCS to local cache")
-                blob.download_to_filename(str(local_path))
-                logger.debug(f"Successfully cached file: {local_path}")
-            except NotFound:
-                logger.error(f"File not found in GCS: {latest_file_path}")
-                raise DataNotFoundError(
-                    f"No data found for {country}/{status.value}"
-                )
-        else:
-            logger.debug(f"Using cached file: {local_path}")
+                # Another request may have finished the download while we waited
+                if local_path.exists():
+                    logger.debug("Using cached file: %s", local_path)
+                    return local_path
+
+                from google.cloud.exceptions import NotFound
+
+                # Download under a unique name and rename into place, so a crash
+                # or failed download never leaves a truncated file at local_path
+                part_path = local_path.with_name(f"{local_path.name}.{uuid.uuid4().hex}.part")
+                try:
+                    logger.info("Downloading %s from GCS to local cache", latest_file_path)
+                    self._download_blob(blob, part_path)
+                    os.replace(part_path, local_path)
+                    # download_to_filename sets the mtime to the blob's upload
+                    # time; _recent_local_copy needs the time it was cached
+                    os.utime(local_path)
+                    logger.debug("Successfully cached file: %s", local_path)
+                except NotFound:
+                    logger.error("File not found in GCS: %s", latest_file_path)
+                    # The cached lookup may point at a version that was since removed
+                    self._latest_cache.pop(folder_path, None)
+                    raise DataNotFoundError(
+                        f"No data found for {country}/{status.value}"
+                    )
+                finally:
+                    part_path.unlink(missing_ok=True)
+                self._remove_stale_versions(country, status, keep=local_path)
+            finally:
+                # Waiters already hold this lock and re-check the file, so the
+                # entry can go; later requests find the file instead
+                if self._download_locks.get(cache_key) is lock:
+                    self._download_locks.pop(cache_key, None)
 
         return local_path
 
+    def _download_blob(self, blob: "storage.Blob", dest: Path) -> None:
+        """
+        Download a blob to `dest`.
+
+        Large files are fetched as concurrent ranged GETs so one download
+        isn't limited to a single TCP connection's throughput; small files
+        use a plain download to avoid the extra requests.
+        """
+        if blob.size is None:
+            blob.reload()  # Size is needed to decide how to download
+        if blob.size < 2 * self.download_chunk_size:
+            blob.download_to_filename(str(dest))
+            return
+
+        from google.cloud.storage import transfer_manager
+
+        # Threads, not processes: forking a server process to download is
+        # unsafe, and the chunk workers spend their time waiting on sockets
+        transfer_manager.download_chunks_concurrently(
+            blob,
+            str(dest),
+            chunk_size=self.download_chunk_size,
+            worker_type=transfer_manager.THREAD,
+            max_workers=self.download_workers,
+        )
+
+    def _cached_versions(self, country: str, status: DatasetStatus) -> list[Path]:
+        """
+        Cached files of exactly this country/status dataset.
+
+        Countries may contain underscores, so the `{country}_{status}_`
+        prefix alone would also match e.g. country `x_raw` when looking
+        for `x`/`raw`; the rest of the name must be a version.
+        """
+        prefix = f"{country}_{status.value}_"
+        return [
+            path
+            for path in self.temp_dir.glob(f"{glob.escape(prefix)}*.parquet")
+            if _CACHE_VERSION_RE.fullmatch(path.name[len(prefix):])
+        ]
+
+    def _recent_local_copy(self, country: str, status: DatasetStatus) -> Path | None:
+        """
+        Return the cached copy of a dataset if it was downloaded within
+        `gcs_latest_ttl` seconds, so GCS isn't listed at all.
+
+        Covers worker processes that share the temp directory but not each
+        other's in-memory lookup cache.
+        """
+        now = time.time()
+        newest: Path | None = None
+        newest_mtime = 0.0
+        for path in self._cached_versions(country, status):
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                continue  # Removed by a concurrent stale-version cleanup
+            if mtime > newest_mtime:
+                newest, newest_mtime = path, mtime
+        if newest is not None and now - newest_mtime < self.latest_ttl:
+            return newest
+        return None
+
+    def _remove_stale_versions(
+        self,
+        country: str,
+        status: DatasetStatus,
+        keep: Path,
+    ) -> None:
+        """
+        Delete older cached versions of a country/status dataset.
+
+        Each new upstream version is cached under a new filename, so without
+        this the temp directory grows by one full dataset per release.
+
+        The most recent previous version is kept as well: requests that
+        resolved its path just before the new download only open the file
+        later (schema probe, then the DuckDB scan), so deleting it would
+        fail them mid-rollover. It is removed on the next rollover.
+        """
+        previous: list[tuple[float, Path]] = []
+        for path in self._cached_versions(country, status):
+            if path == keep:
+                continue
+            try:
+                previous.append((path.stat().st_mtime, path))
+            except OSError:
+                continue  # Removed concurrently
+
+        previous.sort(reverse=True)
+        for _, path in previous[1:]:
+            try:
+                path.unlink()
+                logger.info("Removed stale cached file: %s", path)
+            except OSError as e:
+                logger.warning("Could not remove stale cached file %s: %s", path, e)
+
     def list_available_countries(self) -> list[str]:
         """
         List available countries in the GCS bucket.
@@ -214,12 +402,31 @@ class GCSService:
         return sorted(countries)
 
 
+def gcs_errors() -> tuple[type[Exception], ...]:
+    """
+    Exceptions raised when GCS is unreachable or misconfigured.
+
+    For probes that should report GCS as unavailable rather than fail.
+    The google packages are imported on demand, like the storage client.
+    """
+    from google.api_core.exceptions import GoogleAPIError
+    from google.auth.exceptions import GoogleAuthError
+
+    # OSError covers network errors (requests' exceptions subclass it);
+    # RuntimeError is GCSService failing to set up its temp directory
+    return (GoogleAPIError, GoogleAuthError, OSError, RuntimeError)
+
+
 _gcs_service: GCSService | None = None
+_gcs_service_lock = threading.Lock()
 
 
 def get_gcs_service() -> GCSService:
     """Get singleton GCS service instance."""
     global _gcs_service
     if _gcs_service is None:
-        _gcs_service = GCSService()
+        # Startup warm-up and the first requests can race to create it
+        with _gcs_service_lock:
+            if _gcs_service is None:
+                _gcs_service = GCSService()
     return _gcs_service
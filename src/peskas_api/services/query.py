@@ -5,29 +5,150 @@ All SQL generation and execution happens here. Schema-specific
 assumptions (like date column name) are isolated and configurable.
 """
 
+import csv
 import functools
 import logging
-import math
 import re
+import threading
 from datetime import date
-from io import StringIO
+from io import BytesIO, StringIO
 from pathlib import Path
-from typing import Iterator
+from typing import Iterator, Sequence
 
 import duckdb
-import pandas as pd
+import orjson
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 
 from peskas_api.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Safe column name: alphanumeric, underscore, hyphen
+_COLUMN_NAME_RE = re.compile(r"[a-zA-Z0-9_-]+")
+
+# A CSV value must be quoted only if it contains one of these (RFC 4180)
+_CSV_SPECIAL_RE = r'[",\r\n]'
+_CSV_UNQUOTED = pa_csv.WriteOptions(include_header=False, quoting_style="none")
+
+
+def _csv_schema(schema: pa.Schema) -> pa.Schema:
+    """Schema for CSV output: timestamps are truncated to whole seconds."""
+    return pa.schema(
+        [
+            field.with_type(pa.timestamp("s", tz=field.type.tz))
+            if pa.types.is_timestamp(field.type)
+            else field
+            for field in schema
+        ]
+    )
+
+
+def _csv_header(schema: pa.Schema) -> bytes:
+    """CSV header row, quoted only where needed."""
+    out = StringIO()
+    csv.writer(out, lineterminator="\n").writerow(schema.names)
+    return out.getvalue().encode()
+
+
+def _is_text_type(data_type: pa.DataType) -> bool:
+    """Whether CSV values of this type may contain quotes, commas or newlines."""
+    return not (
+        pa.types.is_integer(data_type)
+        or pa.types.is_floating(data_type)
+        or pa.types.is_decimal(data_type)
+        or pa.types.is_temporal(data_type)
+        or pa.types.is_boolean(data_type)
+        or pa.types.is_null(data_type)
+    )
+
+
+def _csv_rows(batch: pa.RecordBatch) -> bytes:
+    """
+    CSV rows for a record batch, quoting only values that need it.
+
+    Arrow's writer quotes every string value (its "needed" style means
+    "may need"), which pandas never did. Batches are therefore written
+    unquoted by Arrow unless a text value actually contains a quote, comma
+    or line break; only such batches are formatted by the csv module, from
+    the same Arrow string casts so values look alike either way.
+    """
+    needs_quoting = any(
+        pc.any(pc.match_substring_regex(column.cast(pa.string()), _CSV_SPECIAL_RE)).as_py()
+        for field, column in zip(batch.schema, batch.columns)
+        if _is_text_type(field.type)
+    )
+    if not needs_quoting:
+        sink = BytesIO()
+        pa_csv.write_csv(batch, sink, write_options=_CSV_UNQUOTED)
+        return sink.getvalue()
+
+    out = StringIO()
+    csv.writer(out, lineterminator="\n").writerows(
+        zip(*(column.cast(pa.string()).to_pylist() for column in batch.columns))
+    )
+    return out.getvalue().encode()
+
+
+def _json_safe(table: pa.Table) -> pa.Table:
+    """
+    Prepare a result table for JSON records, column by column in Arrow.
+
+    Date and timestamp columns become `YYYY-MM-DDTHH:MM:SS` strings and
+    NaN/Infinity floats become nulls (None after to_pylist()).
+    """
+    for i, field in enumerate(table.schema):
+        if pa.types.is_floating(field.type):
+            col = table.column(i)
+            table = table.set_column(i, field.name, pc.if_else(pc.is_finite(col), col, None))
+        elif pa.types.is_timestamp(field.type) or pa.types.is_date(field.type):
+            # Whole seconds: %S would otherwise include the fraction
+            tz = getattr(field.type, "tz", None)
+            col = table.column(i).cast(pa.timestamp("s", tz=tz), safe=False)
+            table = table.set_column(
+                i, field.name, pc.strftime(col, format="%Y-%m-%dT%H:%M:%S")
+            )
+    return table
+
+
+@functools.lru_cache(maxsize=32)
+def _query_template(col_expr: str, conditions: tuple[str, ...]) -> str:
+    """
+    SQL for a projection and set of filter conditions.
+
+    The Parquet path, filter values and row limit are all bound parameters,
+    so one template serves every file version and filter value.
+    """
+    query = f"SELECT {col_expr} FROM read_parquet(?)"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    return query + " LIMIT ?"
+
 
 class QueryService:
     """Service for querying Parquet files with DuckDB."""
 
+    # Equality filters as (argument, column) in emission order; each becomes
+    # a fixed condition string, so the condition tuple is a template key
+    _FILTER_SPEC: tuple[tuple[str, str], ...] = (
+        ("gaul_1", "gaul_1_code"),
+        ("gaul_2", "gaul_2_code"),
+        ("catch_taxon", "catch_taxon"),
+        ("survey_id", "survey_id"),
+    )
+
     def __init__(self):
         self.settings = get_settings()
-        self._conn = duckdb.connect(":memory:")
+        config = {}
+        if self.settings.duckdb_threads is not None:
+            # Containers often see more host cores than their CPU quota allows
+            config["threads"] = self.settings.duckdb_threads
+        self._conn = duckdb.connect(":memory:", config=config)
+        # Keep Parquet footers and row-group statistics in memory across
+        # queries; every request reads the same few versioned files. GLOBAL
+        # so the per-request cursors (separate sessions) inherit it.
+        self._conn.execute("SET GLOBAL parquet_metadata_cache = true")
 
     def query_parquet(
         self,
@@ -39,9 +160,9 @@ class QueryService:
         gaul_2: str | None = None,
         catch_taxon: str | None = None,
         survey_id: str | None = None,
-        columns: list[str] | None = None,
+        columns: Sequence[str] | None = None,
         limit: int | None = None,
-    ) -> duckdb.DuckDBPyRelation:
+    ) -> duckdb.DuckDBPyConnection:
         """
         Query a Parquet file with optional filtering.
 
@@ -58,32 +179,94 @@ class QueryService:
             limit: Optional row limit
 
         Returns:
-            DuckDB relation that can be iterated or converted
+            DuckDB cursor holding the executed query's result; the caller
+            should close it once the result has been consumed
+
+        Raises:
+            FileNotFoundError: If the Parquet file does not exist
+            ValueError: If the query is invalid
+        """
+        query, params = self._build_query(
+            parquet_path,
+            date_column=date_column,
+            date_from=date_from,
+            date_to=date_to,
+            gaul_1=gaul_1,
+            gaul_2=gaul_2,
+            catch_taxon=catch_taxon,
+            survey_id=survey_id,
+            columns=columns,
+            limit=limit,
+        )
+
+        # A cursor per query: the shared connection is not thread-safe,
+        # and separate cursors let concurrent requests scan in parallel.
+        # The caller only gets it on success, so close it here on failure.
+        cursor = self._conn.cursor()
+        try:
+            return cursor.execute(query, params)
+        except duckdb.IOException as e:
+            cursor.close()
+            # read_parquet reports a missing file itself; no stat() up front
+            if "No files found" in str(e) or "No such file" in str(e):
+                raise FileNotFoundError(f"Parquet file not found: {parquet_path}") from e
+            logger.error("DuckDB query execution failed: %s - Query: %s", e, query[:200])
+            raise ValueError(f"Query execution failed: {e}") from e
+        except Exception as e:
+            cursor.close()
+            logger.error("DuckDB query execution failed: %s - Query: %s", e, query[:200])
+            raise ValueError(f"Query execution failed: {e}") from e
+
+    def _build_query(
+        self,
+        parquet_path: Path,
+        date_column: str | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        gaul_1: str | None = None,
+        gaul_2: str | None = None,
+        catch_taxon: str | None = None,
+        survey_id: str | None = None,
+        columns: Sequence[str] | None = None,
+        limit: int | None = None,
+    ) -> tuple[str, list]:
+        """
+        Build the SQL query and bound parameters for query_parquet.
+
+        Filters are emitted as plain `"column" <op> ?` comparisons so DuckDB
+        pushes them into the Parquet scan, where row groups whose min/max
+        statistics fall outside the requested values are skipped without
+        being decoded. Avoid wrapping filter columns in functions or casts,
+        which would disable that pushdown; casts belong on the parameter,
+        so its type is fixed by the SQL rather than by the Python value.
+        Conditions are emitted most selective first: date range, GAUL
+        codes, species, survey.
+
+        The Parquet path and row limit are bound parameters too, never
+        spliced into the SQL text.
+
+        Returns:
+            Tuple of (SQL string, parameter list)
         """
         # Build column selection with validation
         if columns:
             available_cols = self._get_columns(parquet_path)
             valid_cols = self._sanitize_columns(columns, available_cols)
             if not valid_cols:
-                logger.warning("No valid columns after sanitization, using all columns")
-                col_expr = "*"
-            else:
-                # Double-quote column names to handle special characters safely
-                col_expr = ", ".join(f'"{c}"' for c in valid_cols)
+                # Never fall back to SELECT *: that would decode every column
+                # chunk of the file for a request that asked for a subset.
+                raise ValueError(
+                    f"None of the requested columns exist in the dataset: {', '.join(columns)}"
+                )
+            # Double-quote column names to handle special characters safely.
+            # Only the selected column chunks are read from the Parquet file.
+            col_expr = ", ".join(f'"{c}"' for c in valid_cols)
         else:
             col_expr = "*"
 
-        # Validate parquet file exists
-        if not parquet_path.exists():
-            raise FileNotFoundError(f"Parquet file not found: {parquet_path}")
-        
-        # Build base query - escape single quotes in path for SQL safety
-        escaped_path = str(parquet_path).replace("'", "''")
-        query = f"SELECT {col_expr} FROM read_parquet('{escaped_path}')"
-
         # Add WHERE clauses
         conditions = []
-        params = []
+        params: list = [str(parquet_path)]
 
         effective_date_column = date_column or self.settings.default_date_column
         
@@ -92,31 +275,24 @@ class QueryService:
             raise ValueError(f"Invalid date column name: {effective_date_column}")
 
         if date_from is not None:
-            conditions.append(f'"{effective_date_column}" >= ?')
+            conditions.append(f'"{effective_date_column}" >= CAST(? AS DATE)')
             params.append(date_from)
 
         if date_to is not None:
-            conditions.append(f'"{effective_date_column}" <= ?')
+            conditions.append(f'"{effective_date_column}" <= CAST(? AS DATE)')
             params.append(date_to)
 
-        if gaul_1 is not None:
-            conditions.append('"gaul_1_code" = ?')
-            params.append(gaul_1)
-
-        if gaul_2 is not None:
-            conditions.append('"gaul_2_code" = ?')
-            params.append(gaul_2)
-
-        if catch_taxon is not None:
-            conditions.append('"catch_taxon" = ?')
-            params.append(catch_taxon)
-
-        if survey_id is not None:
-            conditions.append('"survey_id" = ?')
-            params.append(survey_id)
-
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
+        values = {
+            "gaul_1": gaul_1,
+            "gaul_2": gaul_2,
+            "catch_taxon": catch_taxon,
+            "survey_id": survey_id,
+        }
+        for arg, column in self._FILTER_SPEC:
+            value = values[arg]
+            if value is not None:
+                conditions.append(f'"{column}" = CAST(? AS VARCHAR)')
+                params.append(value)
 
         # Add limit with validation
         if limit is not None and limit < 1:
@@ -126,54 +302,71 @@ class QueryService:
             limit or self.settings.max_rows_default,
             self.settings.max_rows_limit,
         )
-        query += f" LIMIT {effective_limit}"
+        params.append(effective_limit)
 
-        try:
-            return self._conn.execute(query, params)
-        except Exception as e:
-            logger.error(f"DuckDB query execution failed: {e} - Query: {query[:200]}")
-            raise ValueError(f"Query execution failed: {e}") from e
+        return _query_template(col_expr, tuple(conditions)), params
 
-    def _validate_column_name(self, column: str) -> bool:
+    @staticmethod
+    def _validate_column_name(column: str) -> bool:
         """
         Validate that a column name is safe for use in SQL.
         
         Only allows alphanumeric characters, underscores, and hyphens.
         Prevents SQL injection through column names.
         """
-        # Safe pattern: alphanumeric, underscore, hyphen
-        return bool(re.match(r'^[a-zA-Z0-9_-]+$', column))
+        # fullmatch: `$` in re.match would also accept a trailing newline
+        return _COLUMN_NAME_RE.fullmatch(column) is not None
     
-    def _get_columns(self, parquet_path: Path) -> set[str]:
-        """Get available columns from a parquet file."""
+    def _get_columns(self, parquet_path: Path) -> frozenset[str]:
+        """
+        Get available columns from a parquet file (cached).
+
+        Cached files are never rewritten in place (each version has its own
+        filename), but the modification time is part of the key anyway so a
+        replaced file is never served a stale schema.
+        """
         try:
-            escaped_path = str(parquet_path).replace("'", "''")
-            # Read a single row to get column names from the DataFrame
-            # This is more reliable than trying to parse parquet_schema()
-            result = self._conn.execute(
-                f"SELECT * FROM read_parquet('{escaped_path}') LIMIT 1"
-            )
-            df = result.fetchdf()
-            return set(df.columns)
+            mtime_ns = parquet_path.stat().st_mtime_ns
+        except OSError as e:
+            raise ValueError(f"Cannot read parquet file schema: {parquet_path}") from e
+        return _cached_columns(self, str(parquet_path), mtime_ns)
+
+    def _read_columns(self, parquet_path: Path) -> frozenset[str]:
+        """Read available column names from a parquet file."""
+        try:
+            # DESCRIBE only binds the query, so the names come from the file
+            # footer without decoding any data pages. Unlike parquet_schema()
+            # it lists top-level columns only (no root or nested leaf entries).
+            with self._conn.cursor() as cursor:
+                rows = cursor.execute(
+                    "DESCRIBE SELECT * FROM read_parquet(?)", [str(parquet_path)]
+                ).fetchall()
+            return frozenset(row[0] for row in rows)
         except Exception as e:
-            logger.error(f"Failed to read parquet schema from {parquet_path}: {e}")
+            logger.error("Failed to read parquet schema from %s: %s", parquet_path, e)
             raise ValueError(f"Cannot read parquet file schema: {parquet_path}") from e
     
-    def _sanitize_columns(self, columns: list[str], available: set[str]) -> list[str]:
+    def _sanitize_columns(
+        self, columns: Sequence[str], available: frozenset[str]
+    ) -> list[str]:
         """
         Sanitize and validate column names against available columns.
         
         Filters out invalid or non-existent columns and logs warnings.
         """
-        valid_cols = []
-        for col in columns:
-            if not self._validate_column_name(col):
-                logger.warning(f"Invalid column name rejected: {col}")
-                continue
-            if col not in available:
-                logger.warning(f"Column not found in schema: {col}")
-                continue
-            valid_cols.append(col)
+        valid_cols = [
+            col
+            for col in columns
+            if col in available and _COLUMN_NAME_RE.fullmatch(col) is not None
+        ]
+        # Rejections are rare (scopes list known columns), so only then
+        # revisit the input to log why each column was dropped
+        if len(valid_cols) != len(columns) and logger.isEnabledFor(logging.WARNING):
+            for col in columns:
+                if not self._validate_column_name(col):
+                    logger.warning("Invalid column name rejected: %s", col)
+                elif col not in available:
+                    logger.warning("Column not found in schema: %s", col)
         return valid_cols
 
     def stream_csv(
@@ -186,14 +379,15 @@ class QueryService:
         gaul_2: str | None = None,
         catch_taxon: str | None = None,
         survey_id: str | None = None,
-        columns: list[str] | None = None,
+        columns: Sequence[str] | None = None,
         limit: int | None = None,
-    ) -> Iterator[str]:
+    ) -> Iterator[bytes]:
         """
         Stream query results as CSV chunks.
 
-        This enables efficient streaming of large datasets without
-        loading everything into memory.
+        Rows are pulled from DuckDB one record batch at a time, so the
+        first chunk is sent as soon as the first batch is decoded and
+        memory stays bounded by the batch size rather than the result size.
 
         Args:
             parquet_path: Path to parquet file
@@ -207,45 +401,84 @@ class QueryService:
             columns: Optional column filter
             limit: Optional row limit
 
-        Yields:
-            CSV string chunks (first chunk includes header)
+        Returns:
+            Iterator of CSV byte chunks (first chunk includes header)
+
+        Raises:
+            ValueError: If the query is invalid. Raised before the first chunk
+                is produced so callers can still return an error status.
+        """
+        relation = self.query_parquet(
+            parquet_path,
+            date_column=date_column,
+            date_from=date_from,
+            date_to=date_to,
+            gaul_1=gaul_1,
+            gaul_2=gaul_2,
+            catch_taxon=catch_taxon,
+            survey_id=survey_id,
+            columns=columns,
+            limit=limit,
+        )
+        return self._iter_csv(relation, columns)
+
+    def _iter_csv(
+        self,
+        relation: duckdb.DuckDBPyConnection,
+        columns: Sequence[str] | None = None,
+    ) -> Iterator[bytes]:
         """
+        Yield CSV from an executed query in fixed-size byte chunks.
+
+        Batches are written by Arrow's native CSV writer, so no per-row or
+        per-value Python work happens on the serialization path unless a
+        batch holds values that need quoting (see _csv_rows). Output is
+        buffered and sent in `stream_chunk_size` pieces, which keeps the
+        number of ASGI sends low without holding a whole batch per send.
+        """
+        chunk_size = self.settings.stream_chunk_size
         try:
-            relation = self.query_parquet(
-                parquet_path,
-                date_column=date_column,
-                date_from=date_from,
-                date_to=date_to,
-                gaul_1=gaul_1,
-                gaul_2=gaul_2,
-                catch_taxon=catch_taxon,
-                survey_id=survey_id,
-                columns=columns,
-                limit=limit,
-            )
+            reader = relation.to_arrow_reader(self.settings.stream_batch_size)
+            schema = _csv_schema(reader.schema)
+
+            sink = BytesIO()
+            has_rows = False
+            for batch in reader:
+                if batch.num_rows == 0:
+                    continue
+                if not has_rows:
+                    sink.write(_csv_header(schema))
+                    has_rows = True
+                sink.write(_csv_rows(batch.cast(schema, safe=False)))
+                if sink.tell() < chunk_size:
+                    continue
+
+                data = sink.getvalue()
+                end = len(data) - len(data) % chunk_size
+                for start in range(0, end, chunk_size):
+                    yield data[start:start + chunk_size]
+                sink.seek(0)
+                sink.truncate(0)
+                sink.write(data[end:])
+
+            if sink.tell():
+                yield sink.getvalue()
 
-            df = relation.fetchdf()
-            
             # Handle empty results
-            if df.empty:
+            if not has_rows:
                 logger.info("Query returned empty result set")
                 # Return CSV with headers only if columns were specified
                 if columns:
-                    output = StringIO()
-                    pd.DataFrame(columns=columns).to_csv(output, index=False)
-                    yield output.getvalue()
+                    yield _csv_header(schema)
                 else:
-                    yield ""
-                return
-
-            output = StringIO()
-            df.to_csv(output, index=False)
-            yield output.getvalue()
+                    yield b""
         except Exception as e:
-            logger.error(f"Error during CSV streaming: {e}", exc_info=True)
+            logger.error("Error during CSV streaming: %s", e, exc_info=True)
             raise
+        finally:
+            relation.close()
 
-    def _execute_get_as_records(
+    def stream_json(
         self,
         parquet_path: Path,
         date_column: str | None = None,
@@ -255,131 +488,87 @@ class QueryService:
         gaul_2: str | None = None,
         catch_taxon: str | None = None,
         survey_id: str | None = None,
-        columns: list[str] | None = None,
+        columns: Sequence[str] | None = None,
         limit: int | None = None,
-    ) -> list[dict]:
-        try:
-            relation = self.query_parquet(
-                parquet_path,
-                date_column=date_column,
-                date_from=date_from,
-                date_to=date_to,
-                gaul_1=gaul_1,
-                gaul_2=gaul_2,
-                catch_taxon=catch_taxon,
-                survey_id=survey_id,
-                columns=columns,
-                limit=limit,
-            )
-
-            df = relation.fetchdf()
-            
-            # Handle empty results
-            if df.empty:
-                logger.info("Query returned empty result set")
-                return []
-
-            # Convert datetime columns to ISO format strings for JSON serialization
-            for col in df.columns:
-                if hasattr(df[col], "dt"):
-                    df[col] = df[col].dt.strftime("%Y-%m-%dT%H:%M:%S")
-            
-            # Replace NaN, Infinity, -Infinity with None for JSON serialization
-            df = df.replace([float('nan'), float('inf'), float('-inf')], None)
-            
-            # Convert to dict and handle remaining NaN values
-            records = df.to_dict(orient="records")
-            
-            # Additional pass to ensure no NaN values remain (safety check)
-            for record in records:
-                for key, value in record.items():
-                    if isinstance(value, float):
-                        if math.isnan(value) or math.isinf(value):
-                            record[key] = None
-            
-            return records
-        except Exception as e:
-            logger.error(f"Error during record retrieval: {e}", exc_info=True)
-            raise
-
-
-    def get_as_records(
-        self,
-        parquet_path: Path,
-        date_column: str | None = None,
-        date_from: date | None = None,
-        date_to: date | None = None,
-        gaul_1: str | None = None,
-        gaul_2: str | None = None,
-        catch_taxon: str | None = None,
-        survey_id: str | None = None,
-        columns: list[str] | None = None,
-        limit: int | None = None,
-    ) -> list[dict]:
+    ) -> Iterator[bytes]:
         """
-        Get query results as list of dictionaries (for JSON response).
+        Stream query results as a `{"data": [...]}` JSON document.
 
-        Results are cached by query parameters. The cache key includes
-        parquet_path (which embeds a data-version timestamp), so entries
-        automatically become irrelevant when new data is published to GCS.
+        Like stream_csv, rows are converted one record batch at a time, so
+        memory stays bounded by the batch size rather than the result size.
+        Dates become `YYYY-MM-DDTHH:MM:SS` strings and NaN/Infinity null.
 
         Args:
-            Same as query_parquet
+            Same as stream_csv
 
         Returns:
-            List of row dictionaries with JSON-serializable values
+            Iterator of JSON byte chunks that together form one document
+
+        Raises:
+            ValueError: If the query is invalid. Raised before the first chunk
+                is produced so callers can still return an error status.
         """
-        cols_key = tuple(columns) if columns is not None else None
-        return _cached_records(
-            self,
+        relation = self.query_parquet(
             parquet_path,
-            date_column,
-            date_from,
-            date_to,
-            gaul_1,
-            gaul_2,
-            catch_taxon,
-            survey_id,
-            cols_key,
-            limit,
+            date_column=date_column,
+            date_from=date_from,
+            date_to=date_to,
+            gaul_1=gaul_1,
+            gaul_2=gaul_2,
+            catch_taxon=catch_taxon,
+            survey_id=survey_id,
+            columns=columns,
+            limit=limit,
         )
+        return self._iter_json(relation)
+
+    def _iter_json(self, relation: duckdb.DuckDBPyConnection) -> Iterator[bytes]:
+        """Yield the data array framing plus one chunk of records per batch."""
+        try:
+            reader = relation.to_arrow_reader(self.settings.stream_batch_size)
+            yield b'{"data":['
+            separator = b""
+            for batch in reader:
+                if batch.num_rows == 0:
+                    continue
+                records = _json_safe(pa.Table.from_batches([batch])).to_pylist()
+                body = orjson.dumps(
+                    records,
+                    option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+                )
+                # Drop the list brackets: batches join into one array
+                yield separator + body[1:-1]
+                separator = b","
+            if not separator:
+                logger.info("Query returned empty result set")
+            yield b"]}"
+        except Exception as e:
+            logger.error("Error during JSON streaming: %s", e, exc_info=True)
+            raise
+        finally:
+            relation.close()
 
 
-@functools.lru_cache(maxsize=256)
-def _cached_records(
+@functools.lru_cache(maxsize=64)
+def _cached_columns(
     query_svc: QueryService,
-    parquet_path: Path,
-    date_column: str | None,
-    date_from: date | None,
-    date_to: date | None,
-    gaul_1: str | None,
-    gaul_2: str | None,
-    catch_taxon: str | None,
-    survey_id: str | None,
-    columns: tuple[str, ...] | None,
-    limit: int | None,
-) -> list[dict]:
-    """LRU-cached wrapper around QueryService._execute_get_as_records."""
-    return query_svc._execute_get_as_records(
-        parquet_path=parquet_path,
-        date_column=date_column,
-        date_from=date_from,
-        date_to=date_to,
-        gaul_1=gaul_1,
-        gaul_2=gaul_2,
-        catch_taxon=catch_taxon,
-        survey_id=survey_id,
-        columns=list(columns) if columns is not None else None,
-        limit=limit,
-    )
+    parquet_path: str,
+    mtime_ns: int,
+) -> frozenset[str]:
+    """LRU-cached wrapper around QueryService._read_columns."""
+    return query_svc._read_columns(Path(parquet_path))
 
 
 _query_service: QueryService | None = None
+_query_service_lock = threading.Lock()
 
 
 def get_query_service() -> QueryService:
     """Get singleton query service instance."""
     global _query_service
     if _query_service is None:
-        _query_service = QueryService()
+        # Startup warm-up and the first requests can race to create it
+        with _query_service_lock:
+            if _query_service is None:
+                _query_service = QueryService()
     return _query_service
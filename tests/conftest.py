@@ -13,6 +13,8 @@ from fastapi.testclient import TestClient
 # Set test environment variables before importing app
 os.environ["API_SECRET_KEY"] = "test-secret-key"
 os.environ["GCS_BUCKET_NAME"] = "test-bucket"
+# Don't contact GCS from the app lifespan
+os.environ["WARM_UP_ON_STARTUP"] = "false"
 
 
 @pytest.fixture
@@ -32,7 +34,7 @@ def test_parquet(tmp_path: Path) -> Path:
             "gear": ["hand_line", "net", "trap"],
             "vessel_type": ["outrigger", "dhow", "outrigger"],
             "catch_habitat": ["reef", "pelagic", "reef"],
-            "catch_outcome": ["kept", "kept", "released"],
+            "catch_outcome": [1, 1, 0],
             "n_catch": [10, 25, 8],
             "catch_taxon": ["MZZ", "SKJ", "IAX"],
             "length_cm": [25.5, 45.0, 30.0],
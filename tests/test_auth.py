@@ -26,3 +26,12 @@ def test_valid_api_key(client, auth_headers):
     )
     # Should not be 401 or 403
     assert response.status_code not in [401, 403]
+
+
+def test_api_key_header_without_check_api_key(client, auth_headers, monkeypatch):
+    """Key extraction must not need APIKeyBase.check_api_key (FastAPI >= 0.116 only)."""
+    from fastapi.security.api_key import APIKeyBase
+
+    monkeypatch.delattr(APIKeyBase, "check_api_key", raising=False)
+    assert client.get("/api/v1/metadata", headers=auth_headers).status_code == 200
+    assert client.get("/api/v1/metadata").status_code == 401
@@ -93,6 +93,25 @@ def test_missing_required_params(client, auth_headers):
     assert response.status_code == 422
 
 
+def test_invalid_date_range(client, auth_headers):
+    """date_to before date_from should be a validation error, not a 500."""
+    response = client.get(
+        "/api/v1/data/landings?country=zanzibar&date_from=2025-06-01&date_to=2025-01-01",
+        headers=auth_headers,
+    )
+    assert response.status_code == 422
+    assert "date_to must be >= date_from" in response.text
+
+
+def test_unknown_dataset_type(client, auth_headers):
+    """Unknown dataset type should return 404."""
+    response = client.get(
+        "/api/v1/data/not_a_dataset?country=zanzibar",
+        headers=auth_headers,
+    )
+    assert response.status_code == 404
+
+
 def test_csv_content_disposition(client, auth_headers):
     """CSV response should have Content-Disposition header."""
     response = client.get(
@@ -103,3 +122,149 @@ def test_csv_content_disposition(client, auth_headers):
     assert "Content-Disposition" in response.headers
     assert "attachment" in response.headers["Content-Disposition"]
     assert "landings_zanzibar_validated.csv" in response.headers["Content-Disposition"]
+
+
+def test_list_metadata(client, auth_headers):
+    """Metadata listing should include the landings dataset type."""
+    response = client.get("/api/v1/metadata", headers=auth_headers)
+    assert response.status_code == 200
+    assert "landings" in response.json()["dataset_types"]
+
+
+def test_dataset_metadata_with_scope(client, auth_headers):
+    """Scoped metadata should only include fields from that scope."""
+    response = client.get(
+        "/api/v1/metadata/landings?scope=catch_info",
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    fields = response.json()["fields"]
+    assert "catch_taxon" in fields
+    assert "gear" not in fields
+
+
+def test_dataset_metadata_invalid_scope(client, auth_headers):
+    """Unknown scope should return 400."""
+    response = client.get(
+        "/api/v1/metadata/landings?scope=not_a_scope",
+        headers=auth_headers,
+    )
+    assert response.status_code == 400
+
+
+def test_field_metadata(client, auth_headers):
+    """Single field metadata should be returned by name."""
+    response = client.get(
+        "/api/v1/metadata/landings/fields/catch_taxon",
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["name"] == "catch_taxon"
+    assert data["data_type"] == "string"
+
+
+def test_metadata_etag(client, auth_headers):
+    """Metadata responses carry an ETag and revalidate to an empty 304."""
+    response = client.get("/api/v1/metadata/landings", headers=auth_headers)
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"].startswith("private")
+
+    revalidated = client.get(
+        "/api/v1/metadata/landings",
+        headers={**auth_headers, "If-None-Match": etag},
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["ETag"] == etag
+
+    stale = client.get(
+        "/api/v1/metadata/landings",
+        headers={**auth_headers, "If-None-Match": '"stale"'},
+    )
+    assert stale.status_code == 200
+
+
+def test_metadata_matches_response_schema(client, auth_headers):
+    """Metadata is built without validation, so check it against the schema here."""
+    from peskas_api.models.responses import DatasetMetadataResponse
+
+    response = client.get("/api/v1/metadata/landings", headers=auth_headers)
+    assert response.status_code == 200
+    DatasetMetadataResponse.model_validate_json(response.content)
+
+
+def test_field_metadata_not_found(client, auth_headers):
+    """Unknown field should return 404."""
+    response = client.get(
+        "/api/v1/metadata/landings/fields/not_a_field",
+        headers=auth_headers,
+    )
+    assert response.status_code == 404
+
+
+def test_process_time_header(client, auth_headers):
+    """Logged requests should carry the request duration header."""
+    response = client.get("/api/v1/metadata", headers=auth_headers)
+    assert float(response.headers["X-Process-Time"]) >= 0
+
+
+def test_health_not_logged(client):
+    """Health probes should bypass the request logging middleware."""
+    response = client.get("/api/v1/health")
+    assert "X-Process-Time" not in response.headers
+
+
+def test_health_check_caches_gcs_probe(client, monkeypatch):
+    """Repeated health checks within the TTL should probe GCS once."""
+    from peskas_api.api.endpoints import health
+
+    calls = []
+    monkeypatch.setattr(health, "_gcs_probe", None)
+    monkeypatch.setattr(health, "_probe_gcs", lambda: calls.append(1) or True)
+
+    for _ in range(3):
+        response = client.get("/api/v1/health")
+        assert response.json()["gcs_accessible"] is True
+    assert len(calls) == 1
+
+
+def test_csv_gzip(client, auth_headers):
+    """CSV responses should be gzip-compressed when the client accepts it."""
+    response = client.get(
+        "/api/v1/data/landings?country=zanzibar",
+        headers={**auth_headers, "Accept-Encoding": "gzip"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "trip_id" in response.text
+
+
+def test_cors_kwargs():
+    """CORS is off by default and restricted to configured origins."""
+    from peskas_api.core.config import Settings
+    from peskas_api.main import _cors_kwargs
+
+    assert _cors_kwargs(Settings()) is None
+    assert _cors_kwargs(Settings(debug=True))["allow_origins"] == ["*"]
+    kwargs = _cors_kwargs(Settings(cors_origins=["https://example.org"]))
+    assert kwargs["allow_origins"] == ["https://example.org"]
+    assert kwargs["allow_methods"] == ["GET"]
+
+
+def test_cors_headers_per_origin(monkeypatch, auth_headers):
+    """Each allowed origin gets its own Access-Control-Allow-Origin."""
+    from fastapi.testclient import TestClient
+
+    from peskas_api import main
+
+    settings = main.get_settings().model_copy(
+        update={"cors_origins": ["https://a.org", "https://b.org"]}
+    )
+    monkeypatch.setattr(main, "get_settings", lambda: settings)
+    client = TestClient(main.create_app())
+
+    for origin in ("https://a.org", "https://b.org", "https://a.org"):
+        response = client.get("/api/v1/metadata", headers={**auth_headers, "Origin": origin})
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == origin
@@ -0,0 +1,184 @@
+"""GCS service tests."""
+
+import os
+from unittest.mock import MagicMock
+
+from peskas_api.models.enums import DatasetStatus
+from peskas_api.services.gcs import GCSService
+
+
+def test_download_removes_stale_versions(tmp_path, monkeypatch):
+    """A new version should delete cached versions older than the previous one."""
+    svc = GCSService()
+    svc.temp_dir = tmp_path
+
+    old = tmp_path / "zanzibar_validated_20250101000000.parquet"
+    previous = tmp_path / "zanzibar_validated_20250201000000.parquet"
+    other = tmp_path / "zanzibar_raw_20250101000000.parquet"
+    wildcard = tmp_path / "z*_validated_20250101000000.parquet"
+    # Country "zanzibar_validated": shares the glob prefix but isn't stale
+    longer = tmp_path / "zanzibar_validated_validated_20250101000000.parquet"
+    for path in (old, previous, other, wildcard, longer):
+        path.touch()
+    # Downloaded long ago, so they aren't reused as a recent local copy
+    os.utime(old, (0, 0))
+    os.utime(previous, (1, 1))
+    os.utime(longer, (0, 0))
+
+    latest = "zanzibar/validated/trips-validated__20260120143613_7c6156d__.parquet"
+    monkeypatch.setattr(svc, "_get_latest_file", lambda prefix, status: latest)
+    svc._bucket = MagicMock()
+    svc._bucket.blob.return_value.size = 0
+    svc._bucket.blob.return_value.download_to_filename.side_effect = (
+        lambda path: open(path, "wb").close()
+    )
+
+    path = svc.download_parquet("zanzibar", DatasetStatus.VALIDATED)
+
+    assert path == tmp_path / "zanzibar_validated_20260120143613.parquet"
+    assert path.exists()
+    assert not old.exists()
+    # In-flight requests may still be about to open the previous version
+    assert previous.exists()
+    assert other.exists()
+    assert wildcard.exists()
+    assert longer.exists()
+
+    # A country that looks like a glob pattern only matches itself
+    svc._remove_stale_versions("z*", DatasetStatus.VALIDATED, keep=tmp_path / "none")
+    assert path.exists() and previous.exists()
+    assert wildcard.exists()
+
+
+def test_latest_file_lookup_cached():
+    """The newest version should be picked, and the lookup reused instead of listing again."""
+    svc = GCSService()
+    blobs = []
+    for name in (
+        "zanzibar/validated/trips-validated__20250101000000_aaaaaaa__.parquet",
+        "zanzibar/validated/trips-validated__20260120143613_7c6156d__.parquet",
+        "zanzibar/validated/README.md",
+    ):
+        blobs.append(MagicMock())
+        blobs[-1].name = name
+    blob = blobs[1]
+    svc._bucket = MagicMock()
+    svc._bucket.list_blobs.return_value = blobs
+
+    first = svc._get_latest_file("zanzibar/validated/", DatasetStatus.VALIDATED)
+    second = svc._get_latest_file("zanzibar/validated/", DatasetStatus.VALIDATED)
+
+    assert first == second == blob.name
+    assert svc._bucket.list_blobs.call_count == 1
+
+
+def test_recent_local_copy_skips_gcs(tmp_path):
+    """A freshly downloaded local copy should be used without listing GCS."""
+    svc = GCSService()
+    svc.temp_dir = tmp_path
+    local = tmp_path / "zanzibar_validated_20260120143613.parquet"
+    local.touch()
+    svc._bucket = MagicMock()
+
+    assert svc.download_parquet("zanzibar", DatasetStatus.VALIDATED) == local
+    svc._bucket.list_blobs.assert_not_called()
+    # A country that looks like a glob pattern only matches itself
+    assert svc._recent_local_copy("z*", DatasetStatus.VALIDATED) is None
+    # Nor is another country whose name extends this one's prefix
+    (tmp_path / "x_validated_validated_20260120143613.parquet").touch()
+    assert svc._recent_local_copy("x", DatasetStatus.VALIDATED) is None
+
+
+def test_fresh_lookup_skips_local_copy_scan(tmp_path, monkeypatch):
+    """With a fresh in-memory lookup the temp directory is not scanned."""
+    svc = GCSService()
+    svc.temp_dir = tmp_path
+    latest = "zanzibar/validated/trips-validated__20260120143613_7c6156d__.parquet"
+    (tmp_path / "zanzibar_validated_20260120143613.parquet").touch()
+    svc._latest_cache["zanzibar/validated/"] = (float("inf"), latest)
+    svc._bucket = MagicMock()
+
+    def no_scan(country, status):
+        raise AssertionError("temp directory scanned")
+
+    monkeypatch.setattr(svc, "_recent_local_copy", no_scan)
+    path = svc.download_parquet("zanzibar", DatasetStatus.VALIDATED)
+    assert path == tmp_path / "zanzibar_validated_20260120143613.parquet"
+
+
+def test_download_mtime_is_download_time(tmp_path, monkeypatch):
+    """A downloaded file's mtime should be when it was cached, not the upload time."""
+    import time
+
+    svc = GCSService()
+    svc.temp_dir = tmp_path
+    latest = "zanzibar/validated/trips-validated__20260120143613_7c6156d__.parquet"
+    monkeypatch.setattr(svc, "_get_latest_file", lambda prefix, status: latest)
+
+    def download_to_filename(path):
+        open(path, "wb").close()
+        os.utime(path, (0, 0))  # as google-cloud-storage does with blob.updated
+
+    svc._bucket = MagicMock()
+    svc._bucket.blob.return_value.size = 0
+    svc._bucket.blob.return_value.download_to_filename.side_effect = download_to_filename
+
+    path = svc.download_parquet("zanzibar", DatasetStatus.VALIDATED)
+    assert time.time() - path.stat().st_mtime < 60
+    assert svc._recent_local_copy("zanzibar", DatasetStatus.VALIDATED) == path
+
+
+def test_large_blob_downloaded_in_chunks(tmp_path, monkeypatch):
+    """Blobs spanning several chunks should use the concurrent chunked download."""
+    from google.cloud.storage import transfer_manager
+
+    svc = GCSService()
+    svc.download_chunk_size = 1024
+    calls = []
+    monkeypatch.setattr(
+        transfer_manager,
+        "download_chunks_concurrently",
+        lambda blob, filename, **kwargs: calls.append(kwargs),
+    )
+
+    small = MagicMock(size=1024)
+    svc._download_blob(small, tmp_path / "small.parquet")
+    small.download_to_filename.assert_called_once()
+    assert calls == []
+
+    large = MagicMock(size=4096)
+    svc._download_blob(large, tmp_path / "large.parquet")
+    large.download_to_filename.assert_not_called()
+    assert calls[0]["chunk_size"] == 1024
+    assert calls[0]["worker_type"] == transfer_manager.THREAD
+
+
+def test_concurrent_downloads_share_one_request(tmp_path, monkeypatch):
+    """Concurrent cache misses should download once, via a temporary file."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    svc = GCSService()
+    svc.temp_dir = tmp_path
+    latest = "zanzibar/validated/trips-validated__20260120143613_7c6156d__.parquet"
+    monkeypatch.setattr(svc, "_get_latest_file", lambda prefix, status: latest)
+    svc._bucket = MagicMock()
+
+    targets = []
+
+    def download(blob, dest):
+        targets.append(dest)
+        dest.write_bytes(b"data")
+
+    monkeypatch.setattr(svc, "_download_blob", download)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        paths = list(
+            pool.map(lambda _: svc.download_parquet("zanzibar", DatasetStatus.VALIDATED), range(4))
+        )
+
+    assert len(set(paths)) == 1
+    assert paths[0].read_bytes() == b"data"
+    assert len(targets) == 1
+    assert targets[0] != paths[0]
+    assert list(tmp_path.glob("*.part")) == []
+    # Per-version locks don't accumulate once downloads finish
+    assert svc._download_locks == {}
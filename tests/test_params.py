@@ -58,40 +58,19 @@ def test_default_status():
     assert params.status == DatasetStatus.VALIDATED
 
 
-def test_gaul_1_filter():
-    """GAUL level 1 filter should be optional."""
-    params = DatasetQueryParams(
-        country="zanzibar",
-        gaul_1="1696",
-    )
-    assert params.gaul_1 == "1696"
-
-
-def test_gaul_2_filter():
-    """GAUL level 2 filter should be optional."""
-    params = DatasetQueryParams(
-        country="zanzibar",
-        gaul_2="16961",
-    )
-    assert params.gaul_2 == "16961"
-
-
-def test_catch_taxon_filter():
-    """Catch taxon filter should be optional."""
-    params = DatasetQueryParams(
-        country="zanzibar",
-        catch_taxon="MZZ",
-    )
-    assert params.catch_taxon == "MZZ"
-
-
-def test_survey_id_filter():
-    """Survey ID filter should be optional."""
-    params = DatasetQueryParams(
-        country="zanzibar",
-        survey_id="survey_001",
-    )
-    assert params.survey_id == "survey_001"
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("gaul_1", "1696"),
+        ("gaul_2", "16961"),
+        ("catch_taxon", "MZZ"),
+        ("survey_id", "survey_001"),
+    ],
+)
+def test_optional_filter(field, value):
+    """Each filter should be optional and parsed as given."""
+    params = DatasetQueryParams(country="zanzibar", **{field: value})
+    assert getattr(params, field) == value
 
 
 def test_combined_filters():
@@ -111,3 +90,23 @@ def test_combined_filters():
     assert params.survey_id == "survey_001"
     assert params.date_from == date(2025, 1, 1)
     assert params.date_to == date(2025, 2, 28)
+
+
+def test_country_whitespace_stripped():
+    """Country should be stripped and lowercased."""
+    params = DatasetQueryParams(country="  Zanzibar ")
+    assert params.country == "zanzibar"
+
+
+def test_params_frozen():
+    """Parsed parameters should be immutable."""
+    params = DatasetQueryParams(country="zanzibar")
+    with pytest.raises(ValueError):
+        params.country = "timor"
+
+
+@pytest.mark.parametrize("country", ["*", "[a-z]*", "zan/zibar", "../tmp"])
+def test_country_pattern(country):
+    """Country must be a plain identifier: it is used in paths and globs."""
+    with pytest.raises(ValueError):
+        DatasetQueryParams(country=country)
@@ -0,0 +1,269 @@
+"""Query service tests."""
+
+from datetime import date
+
+import orjson
+import pytest
+
+from peskas_api.services.query import QueryService
+
+
+def stream_records(svc: QueryService, path, **kwargs) -> list[dict]:
+    """Records from a streamed JSON response."""
+    return orjson.loads(b"".join(svc.stream_json(path, **kwargs)))["data"]
+
+
+def test_filters_pushed_into_parquet_scan(test_parquet):
+    """Filters should be applied inside the Parquet scan, not after it."""
+    svc = QueryService()
+    query, params = svc._build_query(
+        test_parquet,
+        date_from=date(2025, 2, 1),
+        gaul_1="1696",
+    )
+    plan = "\n".join(row[1] for row in svc._conn.execute(f"EXPLAIN {query}", params).fetchall())
+    # Pushed-down filters are listed under the READ_PARQUET operator
+    # instead of a separate FILTER operator above it.
+    assert "READ_PARQUET" in plan
+    assert "Filters" in plan
+    assert "FILTER " not in plan
+
+
+def test_projection_pushed_into_parquet_scan(test_parquet):
+    """Only the selected columns should be read from the Parquet file."""
+    svc = QueryService()
+    query, params = svc._build_query(test_parquet, columns=["trip_id", "catch_kg"])
+    plan = "\n".join(row[1] for row in svc._conn.execute(f"EXPLAIN {query}", params).fetchall())
+    scan = plan[plan.index("READ_PARQUET"):]
+    assert "Projections" in scan
+    assert "trip_id" in scan and "catch_kg" in scan
+    assert "gear" not in scan
+
+
+def test_filtered_records(test_parquet):
+    """Date and GAUL filters should narrow the result set."""
+    svc = QueryService()
+    records = stream_records(
+        svc,
+        test_parquet,
+        date_from=date(2025, 2, 1),
+        gaul_1="1696",
+    )
+    assert [r["trip_id"] for r in records] == ["trip_2"]
+
+
+def test_unknown_columns_rejected(test_parquet):
+    """Requesting only unknown columns should fail instead of reading all columns."""
+    svc = QueryService()
+    with pytest.raises(ValueError):
+        svc._build_query(test_parquet, columns=["not_a_column"])
+
+
+def test_stream_csv_chunk_size(test_parquet, monkeypatch):
+    """CSV output should be split into chunks of at most stream_chunk_size bytes."""
+    svc = QueryService()
+    full = b"".join(svc.stream_csv(test_parquet))
+
+    monkeypatch.setattr(svc.settings, "stream_chunk_size", 64)
+    chunks = list(svc.stream_csv(test_parquet))
+    assert all(isinstance(c, bytes) for c in chunks)
+    assert all(len(c) == 64 for c in chunks[:-1])
+    assert 0 < len(chunks[-1]) <= 64
+    assert b"".join(chunks) == full
+
+
+def test_stream_csv_quotes_only_when_needed(tmp_path, monkeypatch):
+    """Headers and values are quoted only when needed, as in the pandas output."""
+    import pandas as pd
+
+    path = tmp_path / "quoting.parquet"
+    pd.DataFrame(
+        {
+            "name": ["plain", "a,b", 'q"x'],
+            "n_catch": [1, 2, 3],
+            "catch_kg": [4.5, 6.25, None],
+            "landing_date": pd.to_datetime(["2025-01-15 08:30:00", "2025-02-10 00:00:00", None]),
+        }
+    ).to_parquet(path)
+    expected = (
+        b"name,n_catch,catch_kg,landing_date\n"
+        b"plain,1,4.5,2025-01-15 08:30:00\n"
+        b'"a,b",2,6.25,2025-02-10 00:00:00\n'
+        b'"q""x",3,,\n'
+    )
+
+    svc = QueryService()
+    assert b"".join(svc.stream_csv(path)) == expected
+    # One row per batch: plain rows and rows needing quotes format alike
+    monkeypatch.setattr(svc.settings, "stream_batch_size", 1)
+    assert b"".join(svc.stream_csv(path)) == expected
+
+
+def test_concurrent_queries(test_parquet):
+    """Queries from several threads should not interfere with each other."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    svc = QueryService()
+
+    def run(taxon):
+        return [
+            r["trip_id"]
+            for r in stream_records(svc, test_parquet, catch_taxon=taxon)
+        ]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(run, ["MZZ", "SKJ", "IAX"] * 4))
+    assert results == [["trip_1"], ["trip_2"], ["trip_3"]] * 4
+
+
+def test_parquet_path_bound_as_parameter(test_parquet):
+    """The file path should be a bound parameter, not part of the SQL text."""
+    quoted = test_parquet.with_name("it's.parquet")
+    test_parquet.rename(quoted)
+
+    svc = QueryService()
+    query, params = svc._build_query(quoted, gaul_1="1696")
+    assert str(quoted) not in query
+    assert params[0] == str(quoted)
+    assert len(stream_records(svc, quoted, gaul_1="1696")) == 2
+
+
+def test_columns_cached_per_file(test_parquet, monkeypatch):
+    """The Parquet schema should be read once per file version."""
+    svc = QueryService()
+    calls = []
+    read_columns = svc._read_columns
+
+    def counting_read(path):
+        calls.append(path)
+        return read_columns(path)
+
+    monkeypatch.setattr(svc, "_read_columns", counting_read)
+    svc._build_query(test_parquet, columns=["trip_id"])
+    svc._build_query(test_parquet, columns=["trip_id", "gear"])
+    assert len(calls) == 1
+
+
+def test_parquet_metadata_cache_enabled_for_cursors():
+    """Per-request cursors should inherit the Parquet metadata cache setting."""
+    svc = QueryService()
+    with svc._conn.cursor() as cursor:
+        setting = cursor.execute("SELECT current_setting('parquet_metadata_cache')").fetchone()
+    assert setting == (True,)
+
+
+@pytest.mark.parametrize(
+    "name, valid",
+    [("catch_kg", True), ("gaul-1", True), ("", False), ("a b", False), ('a"', False), ("a\n", False)],
+)
+def test_validate_column_name(name, valid):
+    """Only plain identifier-like column names are accepted."""
+    assert QueryService._validate_column_name(name) is valid
+
+
+def test_records_are_json_safe(tmp_path):
+    """Non-finite floats become None and timestamps ISO strings without fractions."""
+    import pandas as pd
+
+    path = tmp_path / "nan.parquet"
+    pd.DataFrame(
+        {
+            "landing_date": pd.to_datetime(["2025-01-15 08:30:01.5", None]),
+            "catch_kg": [float("nan"), float("inf")],
+            "n_catch": [1, None],
+        }
+    ).to_parquet(path)
+
+    records = stream_records(QueryService(), path)
+    assert records == [
+        {"landing_date": "2025-01-15T08:30:01", "catch_kg": None, "n_catch": 1.0},
+        {"landing_date": None, "catch_kg": None, "n_catch": None},
+    ]
+
+
+def test_sanitize_columns_keeps_order(caplog):
+    """Valid columns keep their requested order; rejected ones are logged."""
+    svc = QueryService()
+    available = frozenset({"trip_id", "gear", 'bad"name'})
+    with caplog.at_level("WARNING"):
+        cols = svc._sanitize_columns(["gear", "missing", 'bad"name', "trip_id"], available)
+    assert cols == ["gear", "trip_id"]
+    assert "Column not found in schema: missing" in caplog.text
+    assert 'Invalid column name rejected: bad"name' in caplog.text
+
+
+def test_stream_json_matches_records(test_parquet, monkeypatch):
+    """Streamed JSON should hold the same records however it is batched."""
+    svc = QueryService()
+    expected = stream_records(svc, test_parquet)
+    assert len(expected) == 3
+    monkeypatch.setattr(svc.settings, "stream_batch_size", 1)
+    assert stream_records(svc, test_parquet) == expected
+
+    empty = b"".join(svc.stream_json(test_parquet, gaul_1="none"))
+    assert empty == b'{"data":[]}'
+
+
+def test_missing_file_raises_file_not_found(tmp_path):
+    """A missing Parquet file is reported by DuckDB as FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        QueryService().query_parquet(tmp_path / "missing.parquet")
+
+
+def test_stream_csv_empty_result_header(test_parquet):
+    """An empty result still gets a header row when columns were requested."""
+    svc = QueryService()
+    body = b"".join(svc.stream_csv(test_parquet, gaul_1="none", columns=["trip_id", "catch_kg"]))
+    assert body == b"trip_id,catch_kg\n"
+    assert b"".join(svc.stream_csv(test_parquet, gaul_1="none")) == b""
+
+
+def test_query_service_singleton_under_concurrency(monkeypatch):
+    """Concurrent first calls should share one QueryService instance."""
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    from peskas_api.services import query
+
+    monkeypatch.setattr(query, "_query_service", None)
+    init = QueryService.__init__
+
+    def slow_init(self):
+        time.sleep(0.05)
+        init(self)
+
+    monkeypatch.setattr(QueryService, "__init__", slow_init)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        services = list(pool.map(lambda _: query.get_query_service(), range(4)))
+    assert all(s is services[0] for s in services)
+
+
+def test_unfiltered_query_has_no_where_clause(test_parquet):
+    """Without filters the SQL has no WHERE clause and its own template."""
+    svc = QueryService()
+    query, params = svc._build_query(test_parquet)
+    assert "WHERE" not in query
+    assert params == [str(test_parquet), svc.settings.max_rows_default]
+    filtered, _ = svc._build_query(test_parquet, gaul_1="1696")
+    assert filtered != query
+
+
+def test_failed_query_closes_cursor(tmp_path, monkeypatch):
+    """A cursor whose query fails is closed, since the caller never receives it."""
+    svc = QueryService()
+    cursors = []
+    real_conn = svc._conn
+
+    class TrackingConn:
+        def cursor(self):
+            cursor = real_conn.cursor()
+            cursors.append(cursor)
+            return cursor
+
+    monkeypatch.setattr(svc, "_conn", TrackingConn())
+    with pytest.raises(FileNotFoundError):
+        svc.query_parquet(tmp_path / "missing.parquet")
+
+    assert len(cursors) == 1
+    with pytest.raises(Exception, match="closed"):
+        cursors[0].execute("SELECT 1")